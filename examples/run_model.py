@@ -5,6 +5,8 @@ Example script demonstrating how to use the Guangdong Energy Model.
 Run with: uv run python examples/run_model.py
 """
 
+import sys
+
 from guangdong_energy_model import model, visualize, data
 from pathlib import Path
 
@@ -14,18 +16,16 @@ def main():
     print("=" * 50)
 
     # Show primary energy data
-    print("\n1. Primary Energy Consumption (PJ/year):")
-    for source, pj in data.PRIMARY_ENERGY_PJ.items():
-        print(f"   {source:12s}: {pj:,} PJ")
-    total_pj = sum(data.PRIMARY_ENERGY_PJ.values())
-    print(f"   {'TOTAL':12s}: {total_pj:,} PJ")
+    lines = ["\n1. Primary Energy Consumption (PJ/year):"]
+    lines += [f"   {source:12s}: {pj:,} PJ" for source, pj in data.PRIMARY_ENERGY_PJ.items()]
+    lines.append(f"   {'TOTAL':12s}: {data.PRIMARY_ENERGY_PJ_TOTAL:,} PJ")
+    sys.stdout.write("\n".join(lines) + "\n")
 
     # Show electricity demand by sector
-    print("\n2. Electricity Demand by Sector (TWh/year):")
-    for sector, twh in data.ELECTRICITY_DEMAND_TWH.items():
-        print(f"   {sector:12s}: {twh:,} TWh")
-    total_twh = sum(data.ELECTRICITY_DEMAND_TWH.values())
-    print(f"   {'TOTAL':12s}: {total_twh:,} TWh")
+    lines = ["\n2. Electricity Demand by Sector (TWh/year):"]
+    lines += [f"   {sector:12s}: {twh:,} TWh" for sector, twh in data.ELECTRICITY_DEMAND_TWH.items()]
+    lines.append(f"   {'TOTAL':12s}: {data.ELECTRICITY_DEMAND_TWH_TOTAL:,} TWh")
+    sys.stdout.write("\n".join(lines) + "\n")
 
     # Create network
     print("\n3. Creating PyPSA Network...")
@@ -40,9 +40,9 @@ def main():
     print(f"   Storage units: {len(network.storage_units)}")
 
     # Show installed capacity
-    print("\n4. Installed Generation Capacity (GW):")
-    for gen_type, gw in data.INSTALLED_CAPACITY_GW.items():
-        print(f"   {gen_type:12s}: {gw:.1f} GW")
+    lines = ["\n4. Installed Generation Capacity (GW):"]
+    lines += [f"   {gen_type:12s}: {gw:.1f} GW" for gen_type, gw in data.INSTALLED_CAPACITY_GW.items()]
+    sys.stdout.write("\n".join(lines) + "\n")
 
     # Solve network
     print("\n5. Running Optimization...")
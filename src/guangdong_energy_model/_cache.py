@@ -0,0 +1,45 @@
+"""
+On-disk caches shared by the data loaders.
+
+Caches live under ``$XDG_CACHE_HOME/guangdong`` (default ``~/.cache``), never
+next to the input files, which may sit in a git submodule or a read-only
+checkout.
+"""
+
+import hashlib
+import os
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+
+
+def cache_dir() -> Path:
+    """Root directory of the package's caches."""
+    root = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(root) / "guangdong"
+
+
+def cache_file(source: Path, prefix: str, suffix: str) -> Path:
+    """Cache path for data derived from ``source``, unique per resolved path."""
+    digest = hashlib.sha256(str(source.resolve()).encode()).hexdigest()[:16]
+    return cache_dir() / f"{prefix}_{digest}{suffix}"
+
+
+def write_atomic(path: Path, write: Callable[[Path], None]) -> None:
+    """Create ``path`` by calling ``write`` on a private temporary file.
+
+    The temporary file gets a unique name in the target directory and is
+    moved into place with os.replace(), so concurrent writers (e.g.
+    batch_solve() workers) never see or clobber a half-written file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+    ) as tmp:
+        tmp_path = Path(tmp.name)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
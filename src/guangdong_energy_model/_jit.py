@@ -0,0 +1,47 @@
+"""
+Optional Numba support.
+
+Numba is an optional dependency (``pip install guangdong-energy-model[fast]``).
+It is imported lazily: ``njit`` only records the function, and the kernel is
+compiled on its first call, so importing the package never pays for numba.
+When numba is not installed the decorated function runs as plain Python;
+callers should check ``numba_available()`` and take their NumPy path instead
+of running the plain-Python loops.
+"""
+
+import functools
+
+
+@functools.cache
+def numba_available() -> bool:
+    """Whether numba can be imported (checked once, on first use)."""
+    try:
+        import numba  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _lazy_jit(func, options):
+    compiled = None
+
+    @functools.wraps(func)
+    def wrapper(*args):
+        nonlocal compiled
+        if compiled is None:
+            if numba_available():
+                import numba
+
+                compiled = numba.njit(**options)(func)
+            else:
+                compiled = func
+        return compiled(*args)
+
+    return wrapper
+
+
+def njit(*args, **kwargs):
+    """Lazy stand-in for ``numba.njit``."""
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return _lazy_jit(args[0], {})
+    return lambda func: _lazy_jit(func, kwargs)
@@ -7,31 +7,82 @@ Falls back to estimated values when data files are not present.
 
 GEM data: download from https://globalenergymonitor.org/projects/global-integrated-power-tracker/download-data/
 PyPSA-China-PIK: git submodule update --init --recursive
+
+PyPSA-China-PIK data is read on first use, not at import.  The values derived
+from it (INSTALLED_CAPACITY_GW, ELECTRICITY_DEMAND_TWH, PEAK_LOAD_GW, ...) are
+module attributes resolved through ``__getattr__`` (PEP 562).
 """
 
+import functools
 import logging
+import threading
 from pathlib import Path
+from types import MappingProxyType
+
+import numpy as np
+
+from ._jit import njit, numba_available
 
 logger = logging.getLogger(__name__)
 
 # --- PyPSA-China-PIK demand data -------------------------------------------
 
-_USE_REAL_DATA = False
-_REAL_DATA = {}
+# Module attributes that only exist once _load_real_data() has run
+_REAL_DATA_ATTRS = frozenset({
+    "_REAL_DATA",
+    "_USE_REAL_DATA",
+    "INSTALLED_CAPACITY_GW",
+    "ELECTRICITY_DEMAND_TWH",
+    "ELECTRICITY_DEMAND_TWH_TOTAL",
+    "PEAK_LOAD_GW",
+    "_SCALED_LOAD_PROFILE_MW",
+})
+
+# Serialises the first load, e.g. from threads calling the data loaders
+_REAL_DATA_LOCK = threading.RLock()
+
+
+def _load_real_data() -> None:
+    """Load PyPSA-China-PIK data and build the values derived from it, once."""
+    global _USE_REAL_DATA, _REAL_DATA
+    if "_REAL_DATA" in globals():
+        return
+    with _REAL_DATA_LOCK:
+        if "_REAL_DATA" in globals():  # loaded while waiting for the lock
+            return
+        try:
+            from . import data_loader
+            summary = data_loader.get_guangdong_summary()
+            _USE_REAL_DATA = True
+            logger.info("Using real data from PyPSA-China-PIK")
+        except Exception as e:
+            summary = {}
+            _USE_REAL_DATA = False
+            logger.warning("PyPSA-China-PIK data not available: %s", e)
+            logger.warning("Using placeholder data. Run: git submodule update --init --recursive")
+
+        _build_derived_data(summary)
+        # Set last: its presence marks the lazy attributes as initialised
+        _REAL_DATA = summary
+
+
+def __getattr__(name: str):
+    if name in _REAL_DATA_ATTRS:
+        _load_real_data()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-try:
-    from . import data_loader
-    _REAL_DATA = data_loader.get_guangdong_summary()
-    _USE_REAL_DATA = True
-    logger.info("Using real data from PyPSA-China-PIK")
-except Exception as e:
-    logger.warning(f"PyPSA-China-PIK data not available: {e}")
-    logger.warning("Using placeholder data. Run: git submodule update --init --recursive")
 
 # --- GEM capacity data -----------------------------------------------------
 
 _GEM_CAPACITIES: dict[str, float] | None = None  # populated by load_gem_data()
 
+# GEM carriers copied into INSTALLED_CAPACITY_GW by _apply_gem_capacities()
+_GEM_KEYS = (
+    "coal", "CCGT", "OCGT", "nuclear", "hydro",
+    "PHS", "solar", "onwind", "offwind", "biomass",
+)
+
 
 def load_gem_data(gem_path: Path | None = None) -> None:
     """Load GEM capacity data.  Called from main() or manually.
@@ -39,46 +90,41 @@ def load_gem_data(gem_path: Path | None = None) -> None:
     Args:
         gem_path: Explicit path to GEM Excel file, or None to auto-detect.
     """
-    global _GEM_CAPACITIES
     from . import gem_loader
 
     caps = gem_loader.load_gem_capacities(gem_path)
     if caps:
-        _GEM_CAPACITIES = caps
-        _apply_gem_capacities()
+        set_gem_capacities(caps)
         logger.info("Installed capacities updated from GEM data")
     else:
         logger.info("GEM data not available — using fallback estimates")
 
 
+def set_gem_capacities(caps: dict[str, float]) -> None:
+    """Use already loaded GEM capacities (GW by carrier)."""
+    global _GEM_CAPACITIES
+    _GEM_CAPACITIES = caps
+    _apply_gem_capacities()
+
+
 def _apply_gem_capacities() -> None:
     """Overwrite INSTALLED_CAPACITY_GW with GEM values where available."""
     if _GEM_CAPACITIES is None:
         return
 
+    _load_real_data()
     gem = _GEM_CAPACITIES
 
-    # Map GEM carriers to the keys used in INSTALLED_CAPACITY_GW.
-    # GEM distinguishes CCGT/OCGT and onwind/offwind; we aggregate to the
-    # broader categories used by the rest of the model.
-    INSTALLED_CAPACITY_GW["coal"] = round(gem.get("coal", 0.0), 1)
-    INSTALLED_CAPACITY_GW["CCGT"] = round(gem.get("CCGT", 0.0), 1)
-    INSTALLED_CAPACITY_GW["OCGT"] = round(gem.get("OCGT", 0.0), 1)
-    INSTALLED_CAPACITY_GW["nuclear"] = round(gem.get("nuclear", 0.0), 1)
-    INSTALLED_CAPACITY_GW["hydro"] = round(gem.get("hydro", 0.0), 1)
-    INSTALLED_CAPACITY_GW["PHS"] = round(gem.get("PHS", 0.0), 1)
-    INSTALLED_CAPACITY_GW["solar"] = round(gem.get("solar", 0.0), 1)
-    INSTALLED_CAPACITY_GW["onwind"] = round(gem.get("onwind", 0.0), 1)
-    INSTALLED_CAPACITY_GW["offwind"] = round(gem.get("offwind", 0.0), 1)
-    INSTALLED_CAPACITY_GW["biomass"] = round(gem.get("biomass", 0.0), 1)
-
-    # Remove the old aggregated keys that are now split
-    INSTALLED_CAPACITY_GW.pop("gas", None)
-    INSTALLED_CAPACITY_GW.pop("wind", None)
+    # GEM distinguishes CCGT/OCGT and onwind/offwind, so the split keys
+    # replace the old aggregated gas/wind entries.
+    INSTALLED_CAPACITY_GW.update({k: round(gem.get(k, 0.0), 1) for k in _GEM_KEYS})
+    for k in ("gas", "wind"):
+        INSTALLED_CAPACITY_GW.pop(k, None)
 
 
 def is_using_real_data() -> bool:
     """Check if real data from PyPSA-China-PIK is being used."""
+    _load_real_data()
     return _USE_REAL_DATA
 
 
@@ -94,36 +140,51 @@ def get_gem_capacities() -> dict[str, float] | None:
 
 def get_real_data_summary() -> dict:
     """Get summary of loaded real data."""
+    _load_real_data()
     return _REAL_DATA
 
 
-def _safe_get(key: str, default: float) -> float:
-    """Safely get numeric value from real data, with fallback."""
-    if not _USE_REAL_DATA:
-        return default
-    value = _REAL_DATA.get(key)
+def _safe_get(summary: dict, key: str, default: float) -> float:
+    """Safely get numeric value from a real data summary, with fallback."""
+    value = summary.get(key)
     if value is None or isinstance(value, str):
         return default
     return float(value)
 
 
+def _build_derived_data(summary: dict) -> None:
+    """Set the module attributes that depend on PyPSA-China-PIK data."""
+    global INSTALLED_CAPACITY_GW, ELECTRICITY_DEMAND_TWH
+    global ELECTRICITY_DEMAND_TWH_TOTAL, PEAK_LOAD_GW, _SCALED_LOAD_PROFILE_MW
+
+    INSTALLED_CAPACITY_GW = _installed_capacity_gw(summary)
+    ELECTRICITY_DEMAND_TWH = _electricity_demand_twh(summary)
+    ELECTRICITY_DEMAND_TWH_TOTAL = sum(ELECTRICITY_DEMAND_TWH.values())
+    PEAK_LOAD_GW = _peak_load_gw(summary)
+    _SCALED_LOAD_PROFILE_MW = LOAD_PROFILE_SUMMER_ARR * (PEAK_LOAD_GW * 1000)
+
+
 # --- Installed capacity (GW) -----------------------------------------------
 # Defaults are estimates; overwritten by _apply_gem_capacities() when GEM is loaded.
 
-_nuclear_gw = _safe_get("nuclear_capacity_mw", 16000) / 1000
+INSTALLED_CAPACITY_GW: dict[str, float]
+
+
+def _installed_capacity_gw(summary: dict) -> dict[str, float]:
+    nuclear_gw = _safe_get(summary, "nuclear_capacity_mw", 16000) / 1000
+    return {
+        "coal": 65.0,        # Thermal coal plants
+        "gas": 25.0,         # Natural gas (CCGT + OCGT combined)
+        "nuclear": round(nuclear_gw, 1),
+        "hydro": 12.0,       # Conventional hydro
+        "solar": 35.0,       # Rapid growth in recent years
+        "wind": 12.0,        # Offshore and onshore combined
+        "biomass": 3.0,      # Waste-to-energy, agricultural
+    }
 
-INSTALLED_CAPACITY_GW: dict[str, float] = {
-    "coal": 65.0,        # Thermal coal plants
-    "gas": 25.0,         # Natural gas (CCGT + OCGT combined)
-    "nuclear": round(_nuclear_gw, 1),
-    "hydro": 12.0,       # Conventional hydro
-    "solar": 35.0,       # Rapid growth in recent years
-    "wind": 12.0,        # Offshore and onshore combined
-    "biomass": 3.0,      # Waste-to-energy, agricultural
-}
 
 # Capacity factors (annual average)
-CAPACITY_FACTORS = {
+CAPACITY_FACTORS = MappingProxyType({
     "coal": 0.55,
     "gas": 0.35,
     "CCGT": 0.40,
@@ -136,10 +197,17 @@ CAPACITY_FACTORS = {
     "onwind": 0.20,
     "offwind": 0.28,
     "biomass": 0.60,
-}
+})
+
+# Ordinal carrier index and matching capacity-factor array for vectorised code
+_CARRIER_INDEX = {name: i for i, name in enumerate(CAPACITY_FACTORS)}
+_CAPACITY_FACTOR_ARR = np.array(
+    [CAPACITY_FACTORS[c] for c in _CARRIER_INDEX], dtype=np.float64
+)
+_CAPACITY_FACTOR_ARR.setflags(write=False)
 
 # Marginal costs in CNY/MWh
-MARGINAL_COSTS_CNY = {
+MARGINAL_COSTS_CNY = MappingProxyType({
     "coal": 350,
     "gas": 550,
     "CCGT": 500,
@@ -152,10 +220,10 @@ MARGINAL_COSTS_CNY = {
     "onwind": 0,
     "offwind": 0,
     "biomass": 200,
-}
+})
 
 # Capital costs in CNY/kW (for expansion planning)
-CAPITAL_COSTS_CNY_KW = {
+CAPITAL_COSTS_CNY_KW = MappingProxyType({
     "coal": 4500,
     "gas": 3500,
     "nuclear": 18000,
@@ -165,10 +233,10 @@ CAPITAL_COSTS_CNY_KW = {
     "wind_offshore": 12000,
     "biomass": 8000,
     "battery_4h": 1500,
-}
+})
 
 # CO2 emissions in tons/MWh
-CO2_EMISSIONS_T_MWH = {
+CO2_EMISSIONS_T_MWH = MappingProxyType({
     "coal": 0.85,
     "gas": 0.40,
     "CCGT": 0.37,
@@ -181,10 +249,10 @@ CO2_EMISSIONS_T_MWH = {
     "onwind": 0.0,
     "offwind": 0.0,
     "biomass": 0.0,  # Considered carbon-neutral
-}
+})
 
 # Primary energy consumption by sector (PJ/year, estimated 2023)
-PRIMARY_ENERGY_PJ = {
+PRIMARY_ENERGY_PJ = MappingProxyType({
     "coal": 4500,       # Including for power, industry, heating
     "oil": 2800,        # Transport, petrochemicals
     "natural_gas": 1200,
@@ -193,23 +261,31 @@ PRIMARY_ENERGY_PJ = {
     "wind": 100,
     "solar": 180,
     "biomass": 200,
-}
+})
+PRIMARY_ENERGY_PJ_TOTAL = sum(PRIMARY_ENERGY_PJ.values())
 
 # Electricity consumption by sector (TWh/year)
 # Total from real data: 912 TWh (2025), distributed by typical shares
-_total_demand_twh = _safe_get("annual_demand_2025_twh", 800)
+ELECTRICITY_DEMAND_TWH: MappingProxyType
+ELECTRICITY_DEMAND_TWH_TOTAL: int
+
+_SECTORS = ("industrial", "commercial", "residential", "transport", "agriculture")
+_SECTOR_SHARES = np.array([0.65, 0.175, 0.125, 0.03, 0.02])  # sums to 100%
+
+
+def _electricity_demand_twh(summary: dict) -> MappingProxyType:
+    total_demand_twh = _safe_get(summary, "annual_demand_2025_twh", 800)
+    values = np.round(total_demand_twh * _SECTOR_SHARES).astype(int)
+    return MappingProxyType(dict(zip(_SECTORS, values.tolist())))
 
-ELECTRICITY_DEMAND_TWH = {
-    "industrial": round(_total_demand_twh * 0.65),   # 65%
-    "commercial": round(_total_demand_twh * 0.175),  # 17.5%
-    "residential": round(_total_demand_twh * 0.125), # 12.5%
-    "transport": round(_total_demand_twh * 0.03),    # 3%
-    "agriculture": round(_total_demand_twh * 0.02),  # 2%
-}
 
 # Peak load in GW (from real hourly data if available)
-_peak_mw = _safe_get("peak_demand_mw", 145000)
-PEAK_LOAD_GW = round(_peak_mw / 1000, 1)
+PEAK_LOAD_GW: float
+
+
+def _peak_load_gw(summary: dict) -> float:
+    return round(_safe_get(summary, "peak_demand_mw", 145000) / 1000, 1)
+
 
 # Typical load profile factors (hourly, normalized)
 # Simplified 24-hour profile for a typical summer day
@@ -236,8 +312,21 @@ WIND_PROFILE = [
     0.48, 0.50, 0.48, 0.45, 0.42, 0.38,  # 18:00 - 23:00
 ]
 
+
+def _frozen_array(values) -> np.ndarray:
+    """Return a read-only float64 array copy of ``values``."""
+    arr = np.array(values, dtype=np.float64)
+    arr.setflags(write=False)
+    return arr
+
+
+# Array versions of the daily profiles for vectorised code
+LOAD_PROFILE_SUMMER_ARR = _frozen_array(LOAD_PROFILE_SUMMER)
+SOLAR_PROFILE_ARR = _frozen_array(SOLAR_PROFILE)
+WIND_PROFILE_ARR = _frozen_array(WIND_PROFILE)
+
 # Regional breakdown within Guangdong (for multi-node models)
-REGIONS = {
+REGIONS = MappingProxyType({
     "pearl_river_delta": {
         "load_share": 0.70,
         "description": "Guangzhou, Shenzhen, Dongguan, Foshan, etc."
@@ -254,13 +343,13 @@ REGIONS = {
         "load_share": 0.08,
         "description": "Shaoguan, Qingyuan, Yunfu"
     },
-}
+})
 
 # Inter-provincial power transfers (GW capacity)
-IMPORT_CAPACITY_GW = {
+IMPORT_CAPACITY_GW = MappingProxyType({
     "west_east_power": 50.0,  # From Yunnan, Guizhou (hydro)
     "hong_kong_link": 4.0,
-}
+})
 
 
 def get_hourly_demand_profile(n_hours: int = 8760):
@@ -269,6 +358,8 @@ def get_hourly_demand_profile(n_hours: int = 8760):
 
     Uses real data from PyPSA-China-PIK if available,
     otherwise generates synthetic profile from LOAD_PROFILE_SUMMER.
+    Results are cached per ``n_hours``; the returned array is read-only,
+    so copy it before modifying in place.
 
     Args:
         n_hours: Number of hours to return (default: full year)
@@ -276,17 +367,41 @@ def get_hourly_demand_profile(n_hours: int = 8760):
     Returns:
         numpy array of hourly demand in MW
     """
-    import numpy as np
+    return _hourly_demand_cached(n_hours)
 
+
+@functools.lru_cache(maxsize=8)
+def _hourly_demand_cached(n_hours: int):
+    """Build the profile for get_hourly_demand_profile() once per length."""
+    _load_real_data()
+    profile = None
     if _USE_REAL_DATA:
         try:
+            from . import data_loader
             hourly = data_loader.load_hourly_demand()
-            return hourly.values[:n_hours]
+            profile = hourly.values[:n_hours]
         except Exception as e:
-            logger.warning(f"Failed to load hourly data: {e}")
-
-    # Fallback: generate from simplified profile
-    profile = np.array(LOAD_PROFILE_SUMMER)
-    peak_mw = PEAK_LOAD_GW * 1000
-    full_year = np.tile(profile, 365)[:n_hours]
-    return full_year * peak_mw
+            logger.warning("Failed to load hourly data: %s", e)
+
+    if profile is None:
+        # Fallback: repeat the scaled daily profile.  Without Numba,
+        # broadcast_to gives a zero-copy view, so the only allocation is
+        # the final reshape.
+        if numba_available():
+            profile = _scale_tile(LOAD_PROFILE_SUMMER_ARR, PEAK_LOAD_GW * 1000, n_hours)
+        else:
+            n_days = -(-n_hours // 24)
+            days = np.broadcast_to(_SCALED_LOAD_PROFILE_MW, (n_days, 24))
+            profile = days.reshape(-1)[:n_hours]
+
+    profile.setflags(write=False)
+    return profile
+
+
+@njit(cache=True)
+def _scale_tile(profile, peak_mw, n_hours):
+    """Repeat a 24-hour ``profile`` scaled by ``peak_mw`` over ``n_hours``."""
+    out = np.empty(n_hours)
+    for i in range(n_hours):
+        out[i] = profile[i % 24] * peak_mw
+    return out
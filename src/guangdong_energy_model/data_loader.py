@@ -7,11 +7,17 @@ Update with: git submodule update --remote
 
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import functools
 import os
 
+from . import _cache
+from ._jit import njit, numba_available
+
 # Path to PyPSA-China-PIK data
 # Try multiple possible locations
+@functools.cache
 def _find_data_root() -> Path:
     """Find the PyPSA-China-PIK data directory."""
     # Option 1: Relative to this file (development mode)
@@ -38,9 +44,17 @@ DATA_ROOT = _find_data_root()
 PROVINCE = "Guangdong"
 PROVINCE_CODE = "GD"
 
+# Parsed hourly demand series, keyed by CSV path (see load_hourly_demand)
+_HOURLY_CACHE: dict[Path, pd.Series] = {}
+
 
+@functools.cache
 def get_data_path() -> Path:
-    """Get path to PyPSA-China-PIK data directory."""
+    """Get path to PyPSA-China-PIK data directory.
+
+    The existence check runs until it first succeeds; after that the
+    resolved path is returned without touching the filesystem.
+    """
     if not DATA_ROOT.exists():
         raise FileNotFoundError(
             f"PyPSA-China-PIK data not found at {DATA_ROOT}. "
@@ -49,44 +63,102 @@ def get_data_path() -> Path:
     return DATA_ROOT
 
 
+def _cached_binary(csv_path: Path, **read_csv_kwargs) -> Path | None:
+    """Return a Parquet copy of ``csv_path``, rewriting it when stale.
+
+    Later runs read the columnar file and skip CSV tokenising and type
+    inference.  The copy lives in the user cache directory, not next to
+    the CSV inside the data submodule.  Returns None when pyarrow is not
+    installed or the cache cannot be written; callers then read the CSV
+    directly.
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return None
+
+    parquet_path = _cache.cache_file(csv_path, csv_path.stem, ".parquet")
+    try:
+        if (
+            not parquet_path.exists()
+            or parquet_path.stat().st_mtime < csv_path.stat().st_mtime
+        ):
+            df = pd.read_csv(csv_path, **read_csv_kwargs)
+            _cache.write_atomic(
+                parquet_path, lambda tmp: df.to_parquet(tmp, compression="zstd")
+            )
+    except OSError:
+        return None
+    return parquet_path
+
+
 def load_nuclear_capacity() -> float:
     """Load nuclear capacity for Guangdong in MW."""
     path = get_data_path() / "p_nom" / "nuclear_p_nom.csv"
-    df = pd.read_csv(path)
-    row = df[df["Province"] == PROVINCE]
-    if row.empty:
+    df = pd.read_csv(
+        path, index_col="Province", usecols=["Province", "nuclear_capacity"]
+    )
+    if PROVINCE not in df.index:
         return 0.0
-    return float(row["nuclear_capacity"].values[0])
+    return float(df.at[PROVINCE, "nuclear_capacity"])
 
 
 def load_annual_demand(year: int = 2025) -> float:
     """Load annual electricity demand for Guangdong in MWh."""
     path = get_data_path() / "load" / "Provincial_Load_2020_2060_MWh.csv"
-    df = pd.read_csv(path, index_col=0)
+    binary = _cached_binary(path, index_col=0)
+    if binary is not None:
+        df = pd.read_parquet(binary, columns=[str(year)])
+    else:
+        df = pd.read_csv(path, index_col=0)
     if PROVINCE not in df.index:
         raise ValueError(f"Province {PROVINCE} not found in load data")
-    return float(df.loc[PROVINCE, str(year)])
+    return float(df.at[PROVINCE, str(year)])
+
+
+def _read_csv_column(path: Path, column: str) -> pd.Series:
+    """Read a single numeric column from a CSV, parsing no other columns.
+
+    Empty fields become NaN, as with a full pd.read_csv().
+    """
+    if column not in pd.read_csv(path, nrows=0).columns:
+        raise ValueError(f"Province code {column} not found in hourly data")
+    values = pd.read_csv(path, usecols=[column], dtype=np.float64, engine="c")
+    return values[column]
 
 
 def load_hourly_demand() -> pd.Series:
     """
     Load hourly electricity demand profile for Guangdong.
 
+    The CSV is parsed once per process; later calls return the same
+    cached Series, which callers should treat as read-only.
+
     Returns:
         pd.Series with 8760 hourly values in MW
     """
     path = get_data_path() / "load" / "Hourly_demand_of_31_province_China_modified_V2.1.csv"
-    df = pd.read_csv(path)
-    if PROVINCE_CODE not in df.columns:
-        raise ValueError(f"Province code {PROVINCE_CODE} not found in hourly data")
-    return df[PROVINCE_CODE]
+    if path not in _HOURLY_CACHE:
+        # Only the Guangdong column is needed; skip parsing the other provinces
+        binary = _cached_binary(path)
+        if binary is not None:
+            import pyarrow.parquet as pq
+            if PROVINCE_CODE not in pq.read_schema(binary).names:
+                raise ValueError(f"Province code {PROVINCE_CODE} not found in hourly data")
+            hourly = pd.read_parquet(binary, columns=[PROVINCE_CODE])[PROVINCE_CODE]
+        else:
+            hourly = _read_csv_column(path, PROVINCE_CODE)
+        _HOURLY_CACHE[path] = hourly
+    return _HOURLY_CACHE[path]
 
 
 def load_hydro_capacity() -> dict:
     """Load hydro capacity data for Guangdong."""
+    path = get_data_path() / "p_nom" / "hydro_p_nom.h5"
+    if not path.exists():
+        return {}
     try:
         import h5py
-        path = get_data_path() / "p_nom" / "hydro_p_nom.h5"
         with h5py.File(path, "r") as f:
             # Structure depends on HDF5 file format
             # Return empty dict if structure unknown
@@ -117,29 +189,77 @@ def load_cost_data(year: int = 2025) -> pd.DataFrame:
     return pd.read_csv(path)
 
 
+@njit(cache=True)
+def _stats(arr):
+    """Return (min, max, mean) of the non-NaN values of ``arr`` in one pass."""
+    mn = np.inf
+    mx = -np.inf
+    s = 0.0
+    n = 0
+    for x in arr:
+        if np.isnan(x):
+            continue
+        if x < mn:
+            mn = x
+        if x > mx:
+            mx = x
+        s += x
+        n += 1
+    if n == 0:
+        return np.nan, np.nan, np.nan
+    return mn, mx, s / n
+
+
+def _demand_stats(arr: np.ndarray) -> tuple[float, float, float]:
+    """Min, max and mean of an hourly demand array, skipping missing hours.
+
+    Like pandas' skipna reductions, an empty or all-NaN array gives NaN.
+    """
+    if numba_available():
+        mn, mx, avg = _stats(arr)
+    else:
+        valid = arr[~np.isnan(arr)]
+        if valid.size == 0:
+            return np.nan, np.nan, np.nan
+        mn, mx, avg = valid.min(), valid.max(), valid.mean()
+    return float(mn), float(mx), float(avg)
+
+
+@functools.cache
 def get_guangdong_summary() -> dict:
-    """Get summary of all available Guangdong data."""
+    """Get summary of all available Guangdong data.
+
+    The three source files are independent, so they are read concurrently.
+    The summary is computed once per process; treat the returned dict as
+    read-only.
+    """
     summary = {
         "province": PROVINCE,
         "province_code": PROVINCE_CODE,
     }
 
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        nuclear = ex.submit(load_nuclear_capacity)
+        demand = ex.submit(load_annual_demand, 2025)
+        hourly = ex.submit(load_hourly_demand)
+
     try:
-        summary["nuclear_capacity_mw"] = load_nuclear_capacity()
+        summary["nuclear_capacity_mw"] = nuclear.result()
     except Exception as e:
         summary["nuclear_capacity_mw"] = f"Error: {e}"
 
     try:
-        summary["annual_demand_2025_mwh"] = load_annual_demand(2025)
-        summary["annual_demand_2025_twh"] = load_annual_demand(2025) / 1e6
+        mwh = demand.result()
+        summary["annual_demand_2025_mwh"] = mwh
+        summary["annual_demand_2025_twh"] = mwh / 1e6
     except Exception as e:
         summary["annual_demand_2025_twh"] = f"Error: {e}"
 
     try:
-        hourly = load_hourly_demand()
-        summary["peak_demand_mw"] = float(hourly.max())
-        summary["min_demand_mw"] = float(hourly.min())
-        summary["avg_demand_mw"] = float(hourly.mean())
+        mn, mx, avg = _demand_stats(hourly.result().to_numpy(dtype=np.float64))
+        summary["peak_demand_mw"] = mx
+        summary["min_demand_mw"] = mn
+        summary["avg_demand_mw"] = avg
     except Exception as e:
         summary["hourly_demand"] = f"Error: {e}"
 
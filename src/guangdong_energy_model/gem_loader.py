@@ -8,20 +8,47 @@ Data source: https://globalenergymonitor.org/projects/global-integrated-power-tr
 License: CC BY 4.0
 """
 
+import functools
+import hashlib
+import json
 import logging
+from collections.abc import Sequence
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
+from . import _cache
+from ._jit import njit, numba_available
+
 logger = logging.getLogger(__name__)
 
 PROVINCE = "Guangdong"
 
-# Default search paths for the GEM Excel file
-DEFAULT_PATHS = [
+# Default search paths for the GEM Excel file ("data" is relative to the
+# working directory at lookup time)
+DEFAULT_PATHS: tuple[Path, ...] = (
     Path("data"),
-    Path(__file__).parent.parent.parent.parent / "data",
-]
+    Path(__file__).parent.parent.parent / "data",
+)
+
+# Columns of the "Power facilities" sheet used by the model
+_GEM_COLUMNS = (
+    "Country/area",
+    "Subnational unit (state, province)",
+    "Status",
+    "Type",
+    "Technology",
+    "Capacity (MW)",
+)
+
+# Low-cardinality text columns, read as categoricals so the filter masks
+# compare integer codes instead of Python strings
+_GEM_DTYPES = {
+    "Subnational unit (state, province)": "category",
+    "Status": "category",
+    "Type": "category",
+}
 
 # Map GEM Type + Technology to PyPSA carrier names
 _TECH_MAP = {
@@ -55,38 +82,151 @@ _TECH_MAP = {
     ("bioenergy", None): "biomass",
 }
 
+# Type-only fallbacks from _TECH_MAP, used when the technology is unknown
+_FALLBACK_MAP = {t: c for (t, tech), c in _TECH_MAP.items() if tech is None}
+
+# Carrier categories of the mapped 'carrier' column, and their codes
+_CARRIERS = tuple(dict.fromkeys(_TECH_MAP.values()))
+_CARRIER_CODES = {carrier: code for code, carrier in enumerate(_CARRIERS)}
+
 
-def find_gem_file(search_paths: list[Path] | None = None) -> Path | None:
+def find_gem_file(search_paths: Sequence[Path] | None = None) -> Path | None:
     """Find a GEM Excel file in the given or default search paths.
 
     Returns the first .xlsx file matching 'Global-Integrated-Power*' found,
-    or None if no file is found.
+    or None if no file is found.  A found file is memoized per tuple of
+    search paths for the lifetime of the process; misses are not, so a
+    workbook added later is still picked up.
     """
-    paths = search_paths or DEFAULT_PATHS
+    # Resolve per call so relative paths follow the current directory;
+    # dict.fromkeys is an ordered dedupe
+    paths = tuple(dict.fromkeys(p.resolve() for p in search_paths or DEFAULT_PATHS))
+    found = _found_gem_files.get(paths)
+    if found is None:
+        found = _scan_for_gem_file(paths)
+        if found is not None:
+            _found_gem_files[paths] = found
+    return found
+
+
+# find_gem_file() hits, keyed on the search paths
+_found_gem_files: dict[tuple[Path, ...], Path] = {}
+
+
+def _scan_for_gem_file(paths: tuple[Path, ...]) -> Path | None:
     for directory in paths:
         if not directory.is_dir():
             continue
-        matches = sorted(directory.glob("Global-Integrated-Power*.xlsx"))
-        if matches:
-            return matches[-1]  # newest by name
+        newest = None  # newest by name
+        for path in directory.iterdir():
+            name = path.name
+            if (
+                name.startswith("Global-Integrated-Power")
+                and name.endswith(".xlsx")
+                and (newest is None or name > newest.name)
+            ):
+                newest = path
+        if newest is not None:
+            return newest
     return None
 
 
 def load_gem_excel(path: Path) -> pd.DataFrame:
-    """Load the GEM Excel file and return the power facilities sheet."""
-    logger.info(f"Loading GEM data from {path}")
-    df = pd.read_excel(path, sheet_name="Power facilities")
-    logger.info(f"Loaded {len(df)} power facility records")
+    """Load the GEM Excel file and return the power facilities sheet.
+
+    Only the columns in _GEM_COLUMNS are returned (those the sheet has).
+    When pyarrow is installed, the parsed sheet is cached as a .parquet file
+    in the user cache directory and reused for as long as it is newer than
+    the .xlsx.
+    """
+    cache = _cache.cache_file(path, path.stem, ".parquet")
+    if _parquet_available():
+        try:
+            if cache.exists() and cache.stat().st_mtime >= path.stat().st_mtime:
+                df = pd.read_parquet(cache)
+                logger.info("Loaded %d power facility records from %s", len(df), cache)
+                return df
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable GEM cache %s: %s", cache, e)
+
+    logger.info("Loading GEM data from %s", path)
+    df = pd.read_excel(
+        path,
+        sheet_name="Power facilities",
+        # A callable tolerates releases missing some columns (e.g. Technology)
+        usecols=lambda column: column in _GEM_COLUMNS,
+        dtype=_GEM_DTYPES,
+        engine=_excel_engine(),
+    )
+    logger.info("Loaded %d power facility records", len(df))
+    df = _stringify_mixed_text(df)
+
+    if _parquet_available():
+        try:
+            _cache.write_atomic(
+                cache, lambda tmp: df.to_parquet(tmp, compression="zstd")
+            )
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Could not write GEM cache %s: %s", cache, e)
     return df
 
 
+def _stringify_mixed_text(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast mixed-type text columns to str, keeping NaN.
+
+    Workbooks can hold e.g. an int among the Technology strings; pyarrow
+    cannot store mixed object columns, and a failed cache write
+    would be retried on every load.  Columns that are all strings are left
+    untouched.
+    """
+    fixed = {}
+    for column, dtype in df.dtypes.items():
+        if isinstance(dtype, pd.CategoricalDtype):
+            values = dtype.categories
+        elif dtype == object:
+            values = df[column]
+        else:
+            continue
+        if pd.api.types.infer_dtype(values, skipna=True) in ("string", "empty"):
+            continue
+        text = df[column].astype(object)
+        text = text.where(text.isna(), text.astype(str))
+        fixed[column] = text.astype(dtype.name) if dtype == "category" else text
+    return df.assign(**fixed) if fixed else df
+
+
+@functools.cache
+def _excel_engine() -> str | None:
+    """Return "calamine" when the Rust-based reader is usable, else None.
+
+    pandas supports the calamine engine from 2.2 onwards; older versions
+    and installs without python-calamine use pandas' default (openpyxl).
+    """
+    major, minor = (int(part) for part in pd.__version__.split(".")[:2])
+    if (major, minor) < (2, 2):
+        return None
+    try:
+        import python_calamine  # noqa: F401
+    except ImportError:
+        return None
+    return "calamine"
+
+
+def _parquet_available() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
 def filter_guangdong(df: pd.DataFrame, province: str = PROVINCE) -> pd.DataFrame:
     """Filter to operating plants in the given province."""
     col = "Subnational unit (state, province)"
     mask = (df[col] == province) & (df["Status"] == "operating")
-    result = df[mask].copy()
+    result = df.loc[mask]
     logger.info(
-        f"Filtered to {len(result)} operating facilities in {province}"
+        "Filtered to %d operating facilities in %s", len(result), province
     )
     return result
 
@@ -102,24 +242,70 @@ def _map_carrier(gem_type: str, technology: str | None) -> str | None:
         return _TECH_MAP[key]
 
     # Try type-only fallback
-    key_fallback = (gem_type_lower, None)
-    if key_fallback in _TECH_MAP:
-        return _TECH_MAP[key_fallback]
+    if (carrier := _FALLBACK_MAP.get(gem_type_lower)) is not None:
+        return carrier
 
-    logger.warning(f"Unmapped GEM type/technology: {gem_type!r} / {technology!r}")
+    logger.warning("Unmapped GEM type/technology: %r / %r", gem_type, technology)
     return None
 
 
+def _normalized_keys(df: pd.DataFrame) -> tuple[pd.Series, pd.Series]:
+    """Vectorized form of the key normalization in _map_carrier().
+
+    Returns the lower-cased, stripped Type and the stripped Technology,
+    with non-string technologies (NaN, numbers) replaced by NaN.
+    """
+    gem_type = df["Type"].str.lower().str.strip()
+    if "Technology" in df.columns:
+        tech = df["Technology"].astype(object)
+    else:
+        tech = pd.Series(None, index=df.index, dtype=object)
+    is_str = tech.map(type).eq(str)
+    tech = tech.where(is_str)
+    if is_str.any():
+        tech = tech.str.strip()
+    return gem_type, tech
+
+
 def map_technologies(df: pd.DataFrame) -> pd.DataFrame:
-    """Add a 'carrier' column by mapping GEM Type/Technology to PyPSA carriers."""
-    df = df.copy()
-    df["carrier"] = df.apply(
-        lambda row: _map_carrier(row["Type"], row.get("Technology")), axis=1
+    """Add a 'carrier' column by mapping GEM Type/Technology to PyPSA carriers.
+
+    Same rules as _map_carrier() (exact pair first, then the type-only
+    fallback), resolved once per distinct Type/Technology pair into a
+    small code table that is then indexed with the factorized columns.
+    The 'carrier' column is categorical.
+    """
+    carrier_codes = _carrier_codes(df)
+    return df.assign(
+        carrier=pd.Categorical.from_codes(carrier_codes, categories=_CARRIERS)
     )
-    unmapped = df["carrier"].isna().sum()
-    if unmapped:
-        logger.warning(f"{unmapped} facilities could not be mapped to a carrier")
-    return df
+
+
+def _carrier_codes(df: pd.DataFrame) -> np.ndarray:
+    """Index into _CARRIERS for each facility, or -1 where unmapped."""
+    gem_type, tech = _normalized_keys(df)
+    type_codes, types = pd.factorize(gem_type)
+    tech_codes, techs = pd.factorize(tech)
+
+    # carrier_table[type, 1 + tech] -> carrier code.  Column 0 holds the
+    # missing-technology case and the extra last row catches NaN types
+    # (factorize code -1); both default to -1, i.e. unmapped.
+    carrier_table = np.full((len(types) + 1, len(techs) + 1), -1, dtype=np.intp)
+    for i, t in enumerate(types):
+        fallback = _FALLBACK_MAP.get(t)
+        carrier_table[i, 0] = _CARRIER_CODES.get(fallback, -1)
+        for j, te in enumerate(techs, start=1):
+            carrier = _TECH_MAP.get((t, te), fallback)
+            carrier_table[i, j] = _CARRIER_CODES.get(carrier, -1)
+    carrier_codes = carrier_table[type_codes, tech_codes + 1]
+
+    unmapped = carrier_codes < 0
+    if unmapped.any():
+        pairs = df.loc[unmapped, ["Type"]].assign(Technology=tech[unmapped])
+        pairs = sorted(set(map(tuple, pairs.astype(str).to_numpy())))
+        logger.warning("Unmapped GEM type/technology pairs: %s", pairs)
+        logger.warning("%d facilities could not be mapped to a carrier", unmapped.sum())
+    return carrier_codes
 
 
 def get_capacity_by_carrier(df: pd.DataFrame) -> dict[str, float]:
@@ -131,10 +317,39 @@ def get_capacity_by_carrier(df: pd.DataFrame) -> dict[str, float]:
     Returns:
         Dict of carrier -> capacity in GW.
     """
-    mapped = df.dropna(subset=["carrier"])
-    cap = mapped.groupby("carrier")["Capacity (MW)"].sum() / 1000  # MW -> GW
-    result = cap.to_dict()
-    return result
+    codes, carriers = pd.factorize(df["carrier"], sort=False)
+    return _sum_capacity(codes, df["Capacity (MW)"], carriers)
+
+
+def _sum_capacity(
+    codes: np.ndarray, capacity_mw: pd.Series, carriers
+) -> dict[str, float]:
+    """GW per carrier from per-facility carrier codes (-1 = unmapped).
+
+    Carriers without any facility are left out, as with groupby.
+    """
+    mapped = codes >= 0
+    codes = codes[mapped]
+    cap_mw = capacity_mw.to_numpy(np.float64)[mapped]
+    if numba_available():
+        totals = _sum_by(codes, cap_mw, len(carriers))
+    else:
+        totals = np.bincount(codes, weights=cap_mw, minlength=len(carriers))
+    present = np.bincount(codes, minlength=len(carriers)) > 0
+    return {
+        carrier: total / 1000  # MW -> GW
+        for carrier, total, seen in zip(carriers, totals.tolist(), present)
+        if seen
+    }
+
+
+@njit(cache=True)
+def _sum_by(codes, values, n):
+    """Sum ``values`` into ``n`` bins given by integer ``codes``."""
+    out = np.zeros(n)
+    for i in range(codes.size):
+        out[codes[i]] += values[i]
+    return out
 
 
 def load_gem_capacities(
@@ -157,16 +372,47 @@ def load_gem_capacities(
         logger.info("No GEM data file found")
         return None
     if not path.exists():
-        logger.warning(f"GEM file not found: {path}")
+        logger.warning("GEM file not found: %s", path)
         return None
 
+    cache_file = _result_cache_file(path)
     try:
-        df = load_gem_excel(path)
-        df = filter_guangdong(df)
-        df = map_technologies(df)
-        capacities = get_capacity_by_carrier(df)
-        logger.info(f"GEM capacities loaded: {capacities}")
+        capacities = json.loads(cache_file.read_text())
+        logger.info("GEM capacities loaded from %s: %s", cache_file, capacities)
         return capacities
+    except (OSError, ValueError):
+        pass
+
+    try:
+        # Same steps as map_technologies() + get_capacity_by_carrier(),
+        # without materialising the intermediate 'carrier' column
+        df = filter_guangdong(load_gem_excel(path))
+        capacities = _sum_capacity(
+            _carrier_codes(df), df["Capacity (MW)"], _CARRIERS
+        )
+        logger.info("GEM capacities loaded: %s", capacities)
     except Exception as e:
-        logger.error(f"Failed to load GEM data: {e}")
+        logger.error("Failed to load GEM data: %s", e)
         return None
+
+    try:
+        _cache.write_atomic(
+            cache_file, lambda tmp: tmp.write_text(json.dumps(capacities))
+        )
+    except OSError as e:
+        logger.warning("Could not write GEM result cache %s: %s", cache_file, e)
+    return capacities
+
+
+def _result_cache_file(path: Path) -> Path:
+    """Location of the cached load_gem_capacities() result for ``path``.
+
+    The key covers the resolved workbook path, its modification time, the
+    province and the technology mapping, so editing any of them
+    invalidates the cache.
+    """
+    path = path.resolve()
+    mapping = sorted(map(repr, _TECH_MAP.items()))
+    key = repr((str(path), path.stat().st_mtime_ns, PROVINCE, mapping))
+    digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+    return _cache.cache_dir() / f"gem_capacities_{digest}.json"
@@ -6,9 +6,20 @@ Or: python -m guangdong_energy_model.main
 """
 
 import argparse
+import sys
 from pathlib import Path
 
-from . import model, visualize, data
+
+def _write_lines(lines: list[str]) -> None:
+    """Write a section of output lines with a single stdout write."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _format_rows(labels, values, value_fmt: str, indent: int = 2) -> str:
+    """Format ``label: value`` rows as one block of text for a single print."""
+    fmt = " " * indent + "{:15s}: " + value_fmt
+    return "\n".join(fmt.format(label, value) for label, value in zip(labels, values))
 
 
 def main():
@@ -74,25 +85,27 @@ def main():
 
     args = parser.parse_args()
 
+    # Imported here so that --help does not pay for PyPSA/pandas start-up
+    from . import data, model
+
     # Load GEM capacity data (auto-detect or explicit path)
     data.load_gem_data(args.gem_file)
 
-    print("=" * 60)
-    print("Guangdong Province Energy System Model")
-    print("=" * 60)
+    lines = ["=" * 60, "Guangdong Province Energy System Model", "=" * 60]
 
     # Show data source
     if data.is_using_gem_data():
-        print("\nCapacity data: Global Energy Monitor (GEM)")
+        lines.append("\nCapacity data: Global Energy Monitor (GEM)")
     else:
-        print("\nCapacity data: Placeholder estimates")
-        print("  Use --gem-file or place GEM Excel in data/ for real data")
+        lines.append("\nCapacity data: Placeholder estimates")
+        lines.append("  Use --gem-file or place GEM Excel in data/ for real data")
 
     if data.is_using_real_data():
-        print("Demand data:   PyPSA-China-PIK (real data)")
+        lines.append("Demand data:   PyPSA-China-PIK (real data)")
     else:
-        print("Demand data:   Placeholder estimates")
-        print("  Run 'git submodule update --init' for real demand data")
+        lines.append("Demand data:   Placeholder estimates")
+        lines.append("  Run 'git submodule update --init' for real demand data")
+    _write_lines(lines)
 
     # Determine number of snapshots
     snapshots = 8760 if args.full_year else args.snapshots
@@ -107,27 +120,32 @@ def main():
     )
 
     # Print network summary
-    print(f"\nNetwork Summary:")
-    print(f"  Buses: {len(network.buses)}")
-    print(f"  Generators: {len(network.generators)}")
-    print(f"  Loads: {len(network.loads)}")
-    print(f"  Storage Units: {len(network.storage_units)}")
-    print(f"  Lines: {len(network.lines)}")
-    print(f"  Snapshots: {len(network.snapshots)}")
+    lines = [
+        f"\nNetwork Summary:",
+        f"  Buses: {len(network.buses)}",
+        f"  Generators: {len(network.generators)}",
+        f"  Loads: {len(network.loads)}",
+        f"  Storage Units: {len(network.storage_units)}",
+        f"  Lines: {len(network.lines)}",
+        f"  Snapshots: {len(network.snapshots)}",
+    ]
 
     # Print capacity summary
-    print(f"\nInstalled Capacity by Carrier (GW):")
+    lines.append(f"\nInstalled Capacity by Carrier (GW):")
     cap_by_carrier = network.generators.groupby("carrier").p_nom.sum() / 1000
-    for carrier, cap in cap_by_carrier.items():
-        print(f"  {carrier:15s}: {cap:8.1f} GW")
-    print(f"  {'TOTAL':15s}: {cap_by_carrier.sum():8.1f} GW")
+    caps = cap_by_carrier.to_numpy()
+    lines.append(_format_rows(cap_by_carrier.index, caps, "{:8.1f} GW"))
+    lines.append(f"  {'TOTAL':15s}: {caps.sum():8.1f} GW")
 
     # Print load summary
     total_load = network.loads_t.p_set.sum(axis=1)
-    print(f"\nLoad Summary:")
-    print(f"  Peak Load: {total_load.max()/1000:.1f} GW")
-    print(f"  Min Load: {total_load.min()/1000:.1f} GW")
-    print(f"  Total Demand: {total_load.sum()/1000:.1f} GWh")
+    lines += [
+        f"\nLoad Summary:",
+        f"  Peak Load: {total_load.max()/1000:.1f} GW",
+        f"  Min Load: {total_load.min()/1000:.1f} GW",
+        f"  Total Demand: {total_load.sum()/1000:.1f} GWh",
+    ]
+    _write_lines(lines)
 
     if not args.no_solve:
         # Solve network
@@ -137,22 +155,24 @@ def main():
             print("Optimization completed successfully!")
 
             # Print results
+            lines = []
             gen_summary = model.get_generation_summary(network)
             if not gen_summary.empty:
-                print("\nGeneration Summary:")
-                print(gen_summary.to_string())
+                lines.append("\nGeneration Summary:")
+                lines.append(gen_summary.to_string())
 
             emissions = model.get_emissions_summary(network)
             if emissions:
-                print(f"\nEmissions:")
-                print(f"  Total CO2: {emissions['total_co2_tonnes']:,.0f} tonnes")
-                print(f"  CO2 Intensity: {emissions['co2_intensity_kg_mwh']:.1f} kg/MWh")
+                lines.append(f"\nEmissions:")
+                lines.append(f"  Total CO2: {emissions['total_co2_tonnes']:,.0f} tonnes")
+                lines.append(f"  CO2 Intensity: {emissions['co2_intensity_kg_mwh']:.1f} kg/MWh")
 
             costs = model.get_cost_summary(network)
             if costs:
-                print(f"\nCosts:")
-                print(f"  Total Cost: {costs['total_cost_cny']:,.0f} CNY")
-                print(f"  Average Cost: {costs['avg_cost_cny_mwh']:.2f} CNY/MWh")
+                lines.append(f"\nCosts:")
+                lines.append(f"  Total Cost: {costs['total_cost_cny']:,.0f} CNY")
+                lines.append(f"  Average Cost: {costs['avg_cost_cny_mwh']:.2f} CNY/MWh")
+            _write_lines(lines)
 
             # Get yearly statistics and monthly breakdown
             yearly_stats = None
@@ -162,37 +182,54 @@ def main():
                 yearly_stats = model.get_yearly_statistics(network)
                 monthly_gen = model.get_monthly_generation(network)
 
+                lines = []
                 if yearly_stats:
-                    print(f"\n{'='*60}")
-                    print("YEARLY STATISTICS")
-                    print(f"{'='*60}")
-                    print(f"  Total Generation: {yearly_stats['total_generation_twh']:.1f} TWh")
-                    print(f"  Total Demand:     {yearly_stats['total_demand_twh']:.1f} TWh")
-                    print(f"  Peak Demand:      {yearly_stats['peak_demand_gw']:.1f} GW")
-                    print(f"  CO2 Emissions:    {yearly_stats['total_co2_mt']:.1f} Mt")
-                    print(f"  CO2 Intensity:    {yearly_stats['co2_intensity_kg_mwh']:.0f} kg/MWh")
-
-                    print(f"\n  Generation Mix:")
-                    for carrier, pct in sorted(
+                    lines += [
+                        f"\n{'='*60}",
+                        "YEARLY STATISTICS",
+                        f"{'='*60}",
+                        f"  Total Generation: {yearly_stats['total_generation_twh']:.1f} TWh",
+                        f"  Total Demand:     {yearly_stats['total_demand_twh']:.1f} TWh",
+                        f"  Peak Demand:      {yearly_stats['peak_demand_gw']:.1f} GW",
+                        f"  CO2 Emissions:    {yearly_stats['total_co2_mt']:.1f} Mt",
+                        f"  CO2 Intensity:    {yearly_stats['co2_intensity_kg_mwh']:.0f} kg/MWh",
+                    ]
+
+                    lines.append(f"\n  Generation Mix:")
+                    mix = sorted(
                         yearly_stats['generation_mix_pct'].items(),
                         key=lambda x: -x[1]
-                    ):
-                        print(f"    {carrier:15s}: {pct:5.1f}%")
-
-                    print(f"\n  Capacity Factors:")
-                    for carrier, cf in sorted(
+                    )
+                    lines.append(_format_rows(
+                        [c for c, _ in mix], [pct for _, pct in mix],
+                        "{:5.1f}%", indent=4,
+                    ))
+
+                    lines.append(f"\n  Capacity Factors:")
+                    cfs = sorted(
                         yearly_stats['capacity_factors'].items(),
                         key=lambda x: -x[1]
-                    ):
-                        print(f"    {carrier:15s}: {cf*100:5.1f}%")
+                    )
+                    lines.append(_format_rows(
+                        [c for c, _ in cfs], [cf * 100 for _, cf in cfs],
+                        "{:5.1f}%", indent=4,
+                    ))
 
                 if monthly_gen is not None and not monthly_gen.empty:
-                    print(f"\n{'='*60}")
-                    print("MONTHLY GENERATION (TWh)")
-                    print(f"{'='*60}")
-                    print(monthly_gen.round(1).to_string())
+                    lines += [
+                        f"\n{'='*60}",
+                        "MONTHLY GENERATION (TWh)",
+                        f"{'='*60}",
+                        monthly_gen.round(1).to_string(),
+                    ]
+                _write_lines(lines)
+
+            # Generate visualizations (matplotlib is only needed from here on;
+            # the CLI only writes files, so skip any GUI backend)
+            import matplotlib
+            matplotlib.use("Agg")
+            from . import visualize
 
-            # Generate visualizations
             args.output_dir.mkdir(parents=True, exist_ok=True)
             print(f"\nGenerating visualizations in {args.output_dir}...")
             visualize.create_summary_report(
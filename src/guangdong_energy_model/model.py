@@ -8,12 +8,42 @@ This module creates a multi-sector energy system model including:
 - Primary energy supply chains
 """
 
+import functools
+from collections.abc import Iterable
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
 import pypsa
 import pandas as pd
 import numpy as np
 from pathlib import Path
 
 from . import data
+from ._jit import njit, numba_available
+
+
+# Regional distribution of generation capacity (rows: _REGION_NAMES,
+# columns: _SHARE_CARRIERS).  Shares are defined for every carrier that
+# *may* appear in INSTALLED_CAPACITY_GW (both the legacy aggregated keys
+# and the split GEM keys).  Missing carriers are silently skipped.
+_REGION_NAMES = np.array([
+    "pearl_river_delta", "east_guangdong", "west_guangdong", "north_guangdong",
+])
+_SHARE_CARRIERS = np.array([
+    "coal", "gas", "CCGT", "OCGT", "nuclear", "solar",
+    "wind", "onwind", "offwind", "hydro", "PHS", "biomass",
+])
+_REGIONAL_SHARES = np.array([
+    # coal gas  CCGT  OCGT  nucl  solar wind  onw   offw  hydro PHS   bio
+    [0.40, 0.70, 0.70, 0.70, 0.60, 0.50, 0.30, 0.30, 0.30, 0.10, 0.10, 0.50],
+    [0.20, 0.10, 0.10, 0.10, 0.20, 0.15, 0.25, 0.25, 0.25, 0.10, 0.10, 0.15],
+    [0.25, 0.15, 0.15, 0.15, 0.20, 0.20, 0.35, 0.35, 0.35, 0.20, 0.20, 0.20],
+    [0.15, 0.05, 0.05, 0.05, 0.00, 0.15, 0.10, 0.10, 0.10, 0.60, 0.60, 0.15],
+])
+_REGIONAL_SHARES.setflags(write=False)
+
+# Availability of dispatchable generators
+_ONE = np.float64(1.0)
 
 
 def create_network(
@@ -59,16 +89,22 @@ def create_network(
 
 def _add_single_bus(network: pypsa.Network) -> None:
     """Add a single electricity bus for simplified model."""
-    network.add("Bus", "guangdong_elec", carrier="AC", v_nom=500)
-    network.add("Bus", "guangdong_heat", carrier="heat")
-    network.add("Bus", "guangdong_gas", carrier="gas")
+    network.add(
+        "Bus",
+        ["guangdong_elec", "guangdong_heat", "guangdong_gas"],
+        carrier=["AC", "heat", "gas"],
+        v_nom=[500, 1.0, 1.0],  # 1.0 is PyPSA's default v_nom
+    )
 
 
 def _add_regional_buses(network: pypsa.Network) -> None:
     """Add regional buses for multi-node model."""
+    names, carriers, v_noms = [], [], []
     for region in data.REGIONS:
-        network.add("Bus", f"{region}_elec", carrier="AC", v_nom=500)
-        network.add("Bus", f"{region}_heat", carrier="heat")
+        names += [f"{region}_elec", f"{region}_heat"]
+        carriers += ["AC", "heat"]
+        v_noms += [500, 1.0]  # 1.0 is PyPSA's default v_nom
+    network.add("Bus", names, carrier=carriers, v_nom=v_noms)
 
 
 def _add_transmission_lines(network: pypsa.Network) -> None:
@@ -79,16 +115,15 @@ def _add_transmission_lines(network: pypsa.Network) -> None:
         ("pearl_river_delta_elec", "west_guangdong_elec", 12.0),
         ("pearl_river_delta_elec", "north_guangdong_elec", 10.0),
     ]
-    for bus0, bus1, capacity in connections:
-        network.add(
-            "Line",
-            f"{bus0}-{bus1}",
-            bus0=bus0,
-            bus1=bus1,
-            s_nom=capacity * 1000,  # Convert GW to MW
-            x=0.01,
-            r=0.001,
-        )
+    network.add(
+        "Line",
+        [f"{bus0}-{bus1}" for bus0, bus1, _ in connections],
+        bus0=[bus0 for bus0, _, _ in connections],
+        bus1=[bus1 for _, bus1, _ in connections],
+        s_nom=[capacity * 1000 for _, _, capacity in connections],  # GW to MW
+        x=0.01,
+        r=0.001,
+    )
 
 
 def _add_generators(network: pypsa.Network, multi_region: bool) -> None:
@@ -97,151 +132,149 @@ def _add_generators(network: pypsa.Network, multi_region: bool) -> None:
         # Distribute capacity across regions based on typical locations
         _add_regional_generators(network)
     else:
-        bus = "guangdong_elec"
-        for gen_type, capacity_gw in data.INSTALLED_CAPACITY_GW.items():
-            p_max_pu = _get_availability_profile(
-                gen_type, len(network.snapshots)
-            )
-            network.add(
-                "Generator",
-                f"{gen_type}_plant",
-                bus=bus,
-                p_nom=capacity_gw * 1000,  # GW to MW
-                marginal_cost=data.MARGINAL_COSTS_CNY.get(gen_type, 0),
-                carrier=gen_type,
-                p_max_pu=p_max_pu,
-            )
+        gen_types = list(data.INSTALLED_CAPACITY_GW)
+        _add_generator_batch(
+            network,
+            names=[f"{gen_type}_plant" for gen_type in gen_types],
+            buses=["guangdong_elec"] * len(gen_types),
+            gen_types=gen_types,
+            p_nom=[gw * 1000 for gw in data.INSTALLED_CAPACITY_GW.values()],  # GW to MW
+        )
 
 
-def _add_regional_generators(network: pypsa.Network) -> None:
-    """Add generators distributed across regions."""
-    # Regional distribution of generation capacity.
-    # Shares are defined for every carrier that *may* appear in
-    # INSTALLED_CAPACITY_GW (both the legacy aggregated keys and the
-    # split GEM keys).  Missing carriers are silently skipped.
-    regional_shares = {
-        "pearl_river_delta": {
-            "coal": 0.40, "gas": 0.70, "CCGT": 0.70, "OCGT": 0.70,
-            "nuclear": 0.60, "solar": 0.50,
-            "wind": 0.30, "onwind": 0.30, "offwind": 0.30,
-            "hydro": 0.10, "PHS": 0.10, "biomass": 0.50,
-        },
-        "east_guangdong": {
-            "coal": 0.20, "gas": 0.10, "CCGT": 0.10, "OCGT": 0.10,
-            "nuclear": 0.20, "solar": 0.15,
-            "wind": 0.25, "onwind": 0.25, "offwind": 0.25,
-            "hydro": 0.10, "PHS": 0.10, "biomass": 0.15,
-        },
-        "west_guangdong": {
-            "coal": 0.25, "gas": 0.15, "CCGT": 0.15, "OCGT": 0.15,
-            "nuclear": 0.20, "solar": 0.20,
-            "wind": 0.35, "onwind": 0.35, "offwind": 0.35,
-            "hydro": 0.20, "PHS": 0.20, "biomass": 0.20,
-        },
-        "north_guangdong": {
-            "coal": 0.15, "gas": 0.05, "CCGT": 0.05, "OCGT": 0.05,
-            "nuclear": 0.00, "solar": 0.15,
-            "wind": 0.10, "onwind": 0.10, "offwind": 0.10,
-            "hydro": 0.60, "PHS": 0.60, "biomass": 0.15,
-        },
-    }
+def _add_generator_batch(
+    network: pypsa.Network,
+    names: list[str],
+    buses: list[str],
+    gen_types: list[str],
+    p_nom: list[float],
+) -> None:
+    """Add generators in a single network.add call.
+
+    Dispatchable generators keep PyPSA's static ``p_max_pu`` default; only
+    variable carriers get a time series, written as one block.
+    """
+    if not names:
+        return
+    network.add(
+        "Generator",
+        names,
+        bus=buses,
+        p_nom=p_nom,
+        marginal_cost=[data.MARGINAL_COSTS_CNY.get(gt, 0) for gt in gen_types],
+        carrier=gen_types,
+    )
 
     n_snapshots = len(network.snapshots)
+    # One profile per carrier, shared by all regions' generators, stacked
+    # into a single (snapshots, variable generators) block
+    profiles = {
+        gen_type: _get_availability_profile(gen_type, n_snapshots)
+        for gen_type in dict.fromkeys(gen_types)
+    }
+    variable = [
+        (name, profiles[gen_type])
+        for name, gen_type in zip(names, gen_types)
+        if profiles[gen_type] is not _ONE
+    ]
+    if variable:
+        network.generators_t.p_max_pu[[name for name, _ in variable]] = np.stack(
+            [profile for _, profile in variable], axis=1
+        )
 
-    for region, shares in regional_shares.items():
-        bus = f"{region}_elec"
-        for gen_type, share in shares.items():
-            if share <= 0 or gen_type not in data.INSTALLED_CAPACITY_GW:
-                continue
-            capacity = data.INSTALLED_CAPACITY_GW[gen_type] * share * 1000
-            p_max_pu = _get_availability_profile(gen_type, n_snapshots)
-            network.add(
-                "Generator",
-                f"{region}_{gen_type}",
-                bus=bus,
-                p_nom=capacity,
-                marginal_cost=data.MARGINAL_COSTS_CNY.get(gen_type, 0),
-                carrier=gen_type,
-                p_max_pu=p_max_pu,
-            )
 
+def _add_regional_generators(network: pypsa.Network) -> None:
+    """Add generators distributed across regions."""
+    present = np.array([c in data.INSTALLED_CAPACITY_GW for c in _SHARE_CARRIERS])
+    gw = np.array([data.INSTALLED_CAPACITY_GW.get(c, 0.0) for c in _SHARE_CARRIERS])
+    capacity = gw[None, :] * _REGIONAL_SHARES * 1000  # GW to MW
+
+    # Row-major nonzero keeps the region-by-region, carrier-by-carrier order
+    rows, cols = np.nonzero((_REGIONAL_SHARES > 0) & present[None, :])
+    regions = _REGION_NAMES[rows]
+    gen_types = _SHARE_CARRIERS[cols]
+    _add_generator_batch(
+        network,
+        names=[f"{region}_{gen_type}" for region, gen_type in zip(regions, gen_types)],
+        buses=[f"{region}_elec" for region in regions],
+        gen_types=gen_types.tolist(),
+        p_nom=capacity[rows, cols].tolist(),
+    )
 
+
+@functools.lru_cache(maxsize=None)
 def _get_availability_profile(gen_type: str, n_snapshots: int) -> np.ndarray:
-    """Get hourly availability profile for generator type."""
+    """Get hourly availability profile for generator type.
+
+    Results are cached and returned read-only, so every caller with the
+    same arguments shares one array.
+    """
     if gen_type == "solar":
-        profile = np.array(data.SOLAR_PROFILE)
+        profile = data.SOLAR_PROFILE_ARR
     elif gen_type in ("wind", "onwind", "offwind"):
-        profile = np.array(data.WIND_PROFILE)
+        profile = data.WIND_PROFILE_ARR
     else:
         # Dispatchable generators - full availability
-        return 1.0
+        return _ONE
 
-    # Tile or truncate to match snapshots
+    # Repeat or truncate to match snapshots.  broadcast_to is a zero-copy
+    # view, so the reshape is the only allocation.
     if n_snapshots <= 24:
         return profile[:n_snapshots]
-    else:
-        return np.tile(profile, (n_snapshots // 24) + 1)[:n_snapshots]
+    n_days = -(-n_snapshots // 24)
+    tiled = np.broadcast_to(profile, (n_days, 24)).reshape(-1)[:n_snapshots]
+    tiled.setflags(write=False)
+    return tiled
 
 
 def _add_loads(network: pypsa.Network, multi_region: bool) -> None:
     """Add electricity loads by sector."""
     n_snapshots = len(network.snapshots)
-    total_annual_twh = sum(data.ELECTRICITY_DEMAND_TWH.values())
+    total_annual_twh = data.ELECTRICITY_DEMAND_TWH_TOTAL
 
     # Get hourly load profile (real data if available)
     hourly_demand = data.get_hourly_demand_profile(n_snapshots)
 
     if multi_region:
-        for region, info in data.REGIONS.items():
-            bus = f"{region}_elec"
-            p_set = hourly_demand[:n_snapshots] * info["load_share"]
-
-            network.add(
-                "Load",
-                f"{region}_demand",
-                bus=bus,
-                p_set=p_set,
-            )
+        names = [f"{region}_demand" for region in data.REGIONS]
+        buses = [f"{region}_elec" for region in data.REGIONS]
+        shares = np.fromiter(
+            (info["load_share"] for info in data.REGIONS.values()), dtype=np.float64
+        )
     else:
-        # Add sectoral loads
-        for sector, twh in data.ELECTRICITY_DEMAND_TWH.items():
-            sector_share = twh / total_annual_twh
-            network.add(
-                "Load",
-                f"{sector}_load",
-                bus="guangdong_elec",
-                p_set=hourly_demand[:n_snapshots] * sector_share,
-            )
+        # Sectoral loads
+        names = [f"{sector}_load" for sector in data.ELECTRICITY_DEMAND_TWH]
+        buses = ["guangdong_elec"] * len(names)
+        shares = np.fromiter(
+            (twh / total_annual_twh for twh in data.ELECTRICITY_DEMAND_TWH.values()),
+            dtype=np.float64,
+        )
+
+    # (snapshots, loads) matrix as a single outer product
+    p_set = hourly_demand[:n_snapshots, None] * shares[None, :]
+    network.add(
+        "Load",
+        names,
+        bus=buses,
+        p_set=pd.DataFrame(p_set, index=network.snapshots, columns=names),
+    )
 
 
 def _add_storage(network: pypsa.Network, multi_region: bool) -> None:
     """Add energy storage units."""
     bus = "pearl_river_delta_elec" if multi_region else "guangdong_elec"
 
-    # Battery storage (4-hour duration assumed)
-    network.add(
-        "StorageUnit",
-        "battery_storage",
-        bus=bus,
-        p_nom=5000,  # 5 GW
-        max_hours=4,
-        efficiency_store=0.92,
-        efficiency_dispatch=0.92,
-        marginal_cost=5,
-        carrier="battery",
-    )
-
-    # Pumped hydro storage
+    # Battery storage (4-hour duration assumed) and pumped hydro storage
     network.add(
         "StorageUnit",
-        "pumped_hydro",
+        ["battery_storage", "pumped_hydro"],
         bus=bus,
-        p_nom=8000,  # 8 GW
-        max_hours=8,
-        efficiency_store=0.85,
-        efficiency_dispatch=0.87,
-        marginal_cost=2,
-        carrier="pumped_hydro",
+        p_nom=[5000, 8000],  # 5 GW, 8 GW
+        max_hours=[4, 8],
+        efficiency_store=[0.92, 0.85],
+        efficiency_dispatch=[0.92, 0.87],
+        marginal_cost=[5, 2],
+        carrier=["battery", "pumped_hydro"],
     )
 
 
@@ -261,9 +294,22 @@ def _add_imports(network: pypsa.Network, multi_region: bool) -> None:
     )
 
 
+# Solver-specific names of the generic solve_network() tuning options
+_SOLVER_OPTION_NAMES = {
+    "highs": {"time_limit": "time_limit", "mip_rel_gap": "mip_rel_gap"},
+    "gurobi": {"time_limit": "TimeLimit", "mip_rel_gap": "MIPGap"},
+    "cplex": {"time_limit": "timelimit", "mip_rel_gap": "mip.tolerances.mipgap"},
+}
+
+
 def solve_network(
     network: pypsa.Network,
     solver_name: str = "highs",
+    solver_options: dict | None = None,
+    warmstart: str | Path | None = None,
+    time_limit: float | None = None,
+    mip_rel_gap: float | None = None,
+    basis_fn: str | Path | None = None,
 ) -> pypsa.Network:
     """
     Solve the network optimization problem.
@@ -271,28 +317,211 @@ def solve_network(
     Args:
         network: PyPSA network to solve
         solver_name: Solver to use (highs, glpk, gurobi, cplex)
+        solver_options: Options passed to the solver as-is (default: the
+            solver's own defaults)
+        warmstart: Basis file from an earlier solve of a similar network
+        time_limit: Solver time limit in seconds
+        mip_rel_gap: Relative MIP optimality gap
+        basis_fn: File to write the solution basis to, for use as a later
+            ``warmstart``
 
     Returns:
         Solved network
     """
-    network.optimize(solver_name=solver_name)
+    solver_options = dict(solver_options or {})
+
+    for value, option in zip(
+        (time_limit, mip_rel_gap), ("time_limit", "mip_rel_gap")
+    ):
+        if value is None:
+            continue
+        try:
+            solver_options[_SOLVER_OPTION_NAMES[solver_name][option]] = value
+        except KeyError:
+            raise ValueError(
+                f"{option} is not supported for solver {solver_name!r}"
+            ) from None
+
+    kwargs = {}
+    if warmstart is not None:
+        kwargs["warmstart_fn"] = warmstart
+    if basis_fn is not None:
+        kwargs["basis_fn"] = basis_fn
+
+    network.optimize(
+        solver_name=solver_name, solver_options=solver_options, **kwargs
+    )
+    return network
+
+
+def batch_solve(
+    scenarios: Iterable[dict],
+    solver_name: str = "highs",
+    max_workers: int | None = None,
+    **solve_kwargs,
+) -> list[pypsa.Network]:
+    """
+    Create and solve independent scenarios in parallel worker processes.
+
+    Args:
+        scenarios: Keyword arguments for create_network(), one dict per scenario
+        solver_name: Solver to use (highs, glpk, gurobi, cplex)
+        max_workers: Number of worker processes (default: number of CPUs)
+        **solve_kwargs: Further arguments for solve_network()
+
+    Returns:
+        Solved networks, in the same order as ``scenarios``
+
+    Each network is built and solved in its own process (PyPSA networks are
+    not thread-safe).  Workers are spawned rather than forked, as a forked
+    HiGHS hangs once the parent has run a solve, so scripts calling this
+    need an ``if __name__ == "__main__"`` guard.  GEM capacities loaded in
+    the parent are passed on to the workers.  The optimisation model is
+    dropped before a network is sent back; the objective and all results
+    are kept, and the network topology (``sub_networks``) is rebuilt in
+    the parent.
+    """
+    worker = functools.partial(
+        _solve_scenario, solver_name=solver_name, **solve_kwargs
+    )
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(data.get_gem_capacities(),),
+    ) as pool:
+        networks = list(pool.map(worker, scenarios))
+    for network in networks:
+        network.determine_network_topology()
+    return networks
+
+
+def _init_worker(gem_capacities: dict[str, float] | None) -> None:
+    """Initializer for batch_solve() workers."""
+    if gem_capacities is not None:
+        data.set_gem_capacities(gem_capacities)
+
+
+def _solve_scenario(kwargs: dict, **solve_kwargs) -> pypsa.Network:
+    """Worker for batch_solve()."""
+    network = solve_network(create_network(**kwargs), **solve_kwargs)
+    # Neither the optimisation model nor the sub-network objects (which hold
+    # a weak reference back to the network) survive pickling
+    del network.model
+    network.sub_networks["obj"] = None
     return network
 
 
+# Emission factors in array form, with a trailing 0.0 for unknown carriers
+_EMISSION_CARRIERS = pd.Index(tuple(data.CO2_EMISSIONS_T_MWH))
+_EMISSIONS_VEC = np.append(
+    np.fromiter(data.CO2_EMISSIONS_T_MWH.values(), dtype=np.float64), 0.0
+)
+_EMISSIONS_VEC.setflags(write=False)
+
+_MONTH_ABBR = np.array([
+    "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+])
+
+
+def _month_index(months: pd.Index) -> pd.Index:
+    """Month-abbreviation index (object dtype) for month numbers 1-12."""
+    return pd.Index(_MONTH_ABBR[months.to_numpy() - 1], dtype=object, name="Month")
+
+
+def _carrier_codes(
+    network: pypsa.Network, columns: pd.Index | None = None
+) -> tuple[np.ndarray, pd.Index]:
+    """Integer carrier code per generator, and the sorted carrier names.
+
+    This plays the part of a categorical carrier column without changing
+    the dtype of ``network.generators`` (PyPSA's NetCDF export cannot
+    store categoricals).  Generators without a carrier get code -1.  Codes
+    are cached on the network, keyed on a hash of the carrier column, so
+    in-place edits of ``generators.carrier`` are picked up.  If ``columns``
+    is given (e.g. the columns of ``generators_t.p``), the codes are
+    returned in that order.
+    """
+    generators = network.generators
+    key = pd.util.hash_pandas_object(generators.carrier)
+    cached = getattr(network, "_carrier_codes_cache", None)
+    if cached is None or not cached[0].equals(key):
+        codes, carriers = pd.factorize(generators.carrier, sort=True)
+        cached = (key, codes, carriers)
+        network._carrier_codes_cache = cached
+    _, codes, carriers = cached
+
+    if columns is not None and not columns.equals(generators.index):
+        codes = codes[generators.index.get_indexer(columns)]
+    return codes, carriers
+
+
+def _sum_by_carrier(
+    codes: np.ndarray, weights: np.ndarray, n_carriers: int
+) -> np.ndarray:
+    """Sum per-generator ``weights`` by carrier code.
+
+    Generators without a carrier (code -1) are left out, as a pandas
+    groupby on the carrier column would drop them.
+    """
+    valid = codes >= 0
+    return np.bincount(codes[valid], weights=weights[valid], minlength=n_carriers)
+
+
+def _emission_factors(carriers: pd.Index) -> np.ndarray:
+    """CO2 factors (t/MWh) aligned to ``carriers``; 0 for carriers without one."""
+    # get_indexer returns -1 for unknown carriers, which picks the trailing 0
+    return _EMISSIONS_VEC[_EMISSION_CARRIERS.get_indexer(carriers)]
+
+
+def _capacity_by_carrier(network: pypsa.Network) -> pd.Series:
+    """Installed generator capacity (MW) per carrier."""
+    codes, carriers = _carrier_codes(network)
+    capacity = _sum_by_carrier(
+        codes, network.generators.p_nom.to_numpy(), len(carriers)
+    )
+    return pd.Series(capacity, index=carriers.rename("carrier"), name="p_nom")
+
+
+def _gen_by_carrier(network: pypsa.Network) -> pd.DataFrame:
+    """Hourly generation summed by carrier (snapshots x carriers)."""
+    p = network.generators_t.p
+    codes, carriers = _carrier_codes(network, p.columns)
+
+    # Sum column subsets directly; transposing for a row groupby would copy
+    # the (snapshots, generators) matrix twice.
+    values = p.to_numpy()
+    result = pd.DataFrame(
+        {carrier: values[:, codes == k].sum(axis=1) for k, carrier in enumerate(carriers)},
+        index=p.index,
+    )
+    result.columns.name = "carrier"
+    return result
+
+
+def _total_demand(network: pypsa.Network) -> float:
+    """Total demand (MWh) over all loads and snapshots."""
+    return float(network.loads_t.p_set.to_numpy().sum())
+
+
+def _hourly_load(network: pypsa.Network) -> pd.Series:
+    """Total load (MW) per snapshot over all loads."""
+    return network.loads_t.p_set.sum(axis=1)
+
+
 def get_generation_summary(network: pypsa.Network) -> pd.DataFrame:
     """Get summary of generation by carrier."""
     if network.generators_t.p.empty:
         return pd.DataFrame()
 
-    gen_by_carrier = network.generators_t.p.T.groupby(
-        network.generators.carrier
-    ).sum().T
+    gen_by_carrier = _gen_by_carrier(network)
 
     summary = pd.DataFrame({
         "Total Generation (MWh)": gen_by_carrier.sum(),
         "Peak Generation (MW)": gen_by_carrier.max(),
         "Capacity Factor": gen_by_carrier.sum() / (
-            network.generators.groupby("carrier").p_nom.sum() * len(network.snapshots)
+            _capacity_by_carrier(network) * len(network.snapshots)
         ),
     })
     return summary.round(2)
@@ -303,32 +532,36 @@ def get_emissions_summary(network: pypsa.Network) -> dict:
     if network.generators_t.p.empty:
         return {}
 
-    total_emissions = 0
-    for gen in network.generators.index:
-        carrier = network.generators.loc[gen, "carrier"]
-        if carrier in data.CO2_EMISSIONS_T_MWH:
-            generation_mwh = network.generators_t.p[gen].sum()
-            emissions = generation_mwh * data.CO2_EMISSIONS_T_MWH[carrier]
-            total_emissions += emissions
+    p = network.generators_t.p
+    carrier_ids, carriers = _carrier_codes(network, p.columns)
+    factors = _emission_factors(carriers)
+    if numba_available():
+        total_emissions = float(_emissions_kernel(
+            p.to_numpy(np.float64), carrier_ids, factors, len(carriers)
+        ))
+    else:
+        carrier_gen = _sum_by_carrier(
+            carrier_ids, p.to_numpy().sum(axis=0), len(carriers)
+        )
+        total_emissions = float(carrier_gen @ factors)
 
     return {
         "total_co2_tonnes": round(total_emissions, 0),
         "co2_intensity_kg_mwh": round(
-            total_emissions * 1000 / network.loads_t.p_set.sum().sum(), 1
+            total_emissions * 1000 / _total_demand(network), 1
         ),
     }
 
 
 def get_cost_summary(network: pypsa.Network) -> dict:
     """Get cost summary of the solved network."""
-    if not hasattr(network, "objective") or network.objective is None:
+    objective = getattr(network, "objective", None)
+    if objective is None:
         return {}
 
     return {
-        "total_cost_cny": round(network.objective, 0),
-        "avg_cost_cny_mwh": round(
-            network.objective / network.loads_t.p_set.sum().sum(), 2
-        ),
+        "total_cost_cny": round(objective, 0),
+        "avg_cost_cny_mwh": round(objective / _total_demand(network), 2),
     }
 
 
@@ -348,44 +581,37 @@ def get_yearly_statistics(network: pypsa.Network) -> dict:
     hours = len(network.snapshots)
     scale_to_year = 8760 / hours  # Scale factor if not full year
 
-    # Generation by carrier
-    gen_by_carrier = network.generators_t.p.T.groupby(
-        network.generators.carrier
-    ).sum().T
+    # Per-carrier totals from a single pass over the dispatch matrix
+    p = network.generators_t.p
+    codes, carriers = _carrier_codes(network, p.columns)
+    carrier_gen = _sum_by_carrier(codes, p.to_numpy().sum(axis=0), len(carriers))
+    carrier_cap = _capacity_by_carrier(network).to_numpy()
+    factors = _emission_factors(carriers)
 
-    total_generation = gen_by_carrier.sum().sum() * scale_to_year
-    total_demand = network.loads_t.p_set.sum().sum() * scale_to_year
+    total_gen = carrier_gen.sum()
+    total_generation = total_gen * scale_to_year
+    total_demand = _total_demand(network) * scale_to_year
 
     # Capacity factors
-    capacity_factors = {}
-    for carrier in gen_by_carrier.columns:
-        carrier_gen = gen_by_carrier[carrier].sum()
-        carrier_cap = network.generators[
-            network.generators.carrier == carrier
-        ].p_nom.sum()
-        if carrier_cap > 0:
-            capacity_factors[carrier] = carrier_gen / (carrier_cap * hours)
+    has_cap = carrier_cap > 0
+    capacity_factors = dict(zip(
+        carriers[has_cap],
+        (carrier_gen[has_cap] / (carrier_cap[has_cap] * hours)).tolist(),
+    ))
 
     # Generation mix (percentages)
-    gen_mix = {}
-    total_gen = gen_by_carrier.sum().sum()
-    for carrier in gen_by_carrier.columns:
-        gen_mix[carrier] = gen_by_carrier[carrier].sum() / total_gen * 100
+    gen_mix = dict(zip(carriers, (carrier_gen / total_gen * 100).tolist()))
 
     # Emissions
-    total_emissions = 0
-    for carrier in gen_by_carrier.columns:
-        if carrier in data.CO2_EMISSIONS_T_MWH:
-            emissions = gen_by_carrier[carrier].sum() * data.CO2_EMISSIONS_T_MWH[carrier]
-            total_emissions += emissions
-    total_emissions *= scale_to_year
+    total_emissions = float(carrier_gen @ factors) * scale_to_year
 
+    hourly_load = _hourly_load(network)
     return {
         "hours_simulated": hours,
         "total_generation_twh": round(total_generation / 1e6, 2),
         "total_demand_twh": round(total_demand / 1e6, 2),
-        "peak_demand_gw": round(network.loads_t.p_set.sum(axis=1).max() / 1000, 2),
-        "min_demand_gw": round(network.loads_t.p_set.sum(axis=1).min() / 1000, 2),
+        "peak_demand_gw": round(hourly_load.max() / 1000, 2),
+        "min_demand_gw": round(hourly_load.min() / 1000, 2),
         "generation_mix_pct": gen_mix,
         "capacity_factors": capacity_factors,
         "total_co2_mt": round(total_emissions / 1e6, 2),
@@ -407,25 +633,16 @@ def get_monthly_generation(network: pypsa.Network) -> pd.DataFrame:
         return pd.DataFrame()
 
     # Group generation by carrier
-    gen_by_carrier = network.generators_t.p.T.groupby(
-        network.generators.carrier
-    ).sum().T
+    gen_by_carrier = _gen_by_carrier(network)
 
-    # Add month column based on index
-    gen_by_carrier.index = network.snapshots
-    monthly = gen_by_carrier.groupby(gen_by_carrier.index.month).sum()
-    monthly.index.name = "Month"
+    # Group by month
+    monthly = gen_by_carrier.groupby(network.snapshots.month).sum()
 
     # Convert MWh to TWh
     monthly = monthly / 1e6
 
     # Add month names
-    month_names = {
-        1: "Jan", 2: "Feb", 3: "Mar", 4: "Apr",
-        5: "May", 6: "Jun", 7: "Jul", 8: "Aug",
-        9: "Sep", 10: "Oct", 11: "Nov", 12: "Dec"
-    }
-    monthly.index = monthly.index.map(month_names)
+    monthly.index = _month_index(monthly.index)
 
     return monthly.round(3)
 
@@ -440,19 +657,28 @@ def get_monthly_demand(network: pypsa.Network) -> pd.Series:
     Returns:
         Series with monthly demand (TWh)
     """
-    total_load = network.loads_t.p_set.sum(axis=1)
-    total_load.index = network.snapshots
-    monthly = total_load.groupby(total_load.index.month).sum()
-    monthly.index.name = "Month"
+    total_load = _hourly_load(network)
+    monthly = total_load.groupby(network.snapshots.month).sum()
 
     # Convert MWh to TWh
     monthly = monthly / 1e6
 
-    month_names = {
-        1: "Jan", 2: "Feb", 3: "Mar", 4: "Apr",
-        5: "May", 6: "Jun", 7: "Jul", 8: "Aug",
-        9: "Sep", 10: "Oct", 11: "Nov", 12: "Dec"
-    }
-    monthly.index = monthly.index.map(month_names)
+    monthly.index = _month_index(monthly.index)
 
     return monthly.round(3)
+
+
+@njit(cache=True)
+def _emissions_kernel(p, carrier_ids, factors, n_carriers):
+    """Total emissions of a (snapshots, generators) dispatch matrix.
+
+    Generation is accumulated per carrier in one pass over ``p`` and then
+    weighted by the per-carrier emission ``factors``.  Generators with a
+    carrier id of -1 (no carrier) are skipped.
+    """
+    totals = np.zeros(n_carriers)
+    for t in range(p.shape[0]):
+        for j in range(p.shape[1]):
+            if carrier_ids[j] >= 0:
+                totals[carrier_ids[j]] += p[t, j]
+    return (totals * factors).sum()
@@ -2,13 +2,19 @@
 Visualization functions for Guangdong Energy System Model.
 """
 
+import functools
+import gc
+
 import pypsa
 import pandas as pd
 import numpy as np
+import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from pathlib import Path
 
-from . import data
+from . import data, model
 
 # Color scheme for energy carriers
 CARRIER_COLORS = {
@@ -29,18 +35,30 @@ CARRIER_COLORS = {
     "pumped_hydro": "#6699ff",
 }
 
+# Stacking order of the dispatch plot, baseload to peak
+_MERIT_ORDER = (
+    "nuclear", "import_hydro", "hydro", "PHS", "solar",
+    "wind", "onwind", "offwind", "biomass", "coal",
+    "gas", "CCGT", "OCGT",
+)
+_MERIT_RANK = {carrier: i for i, carrier in enumerate(_MERIT_ORDER)}
+
+# savefig() options shared by every plot
+_PNG_KW = {"dpi": 150, "bbox_inches": "tight"}
+
 
 def _source_label() -> str:
     """Return a data source attribution string for plot annotations."""
-    parts = []
-    if data.is_using_gem_data():
-        parts.append("Capacity: Global Energy Monitor (GEM)")
-    else:
-        parts.append("Capacity: Placeholder estimates")
-    if data.is_using_real_data():
-        parts.append("Demand: PyPSA-China-PIK")
-    else:
-        parts.append("Demand: Placeholder estimates")
+    return _format_source_label(data.is_using_gem_data(), data.is_using_real_data())
+
+
+@functools.lru_cache(maxsize=None)
+def _format_source_label(gem: bool, real: bool) -> str:
+    parts = [
+        "Capacity: Global Energy Monitor (GEM)" if gem
+        else "Capacity: Placeholder estimates",
+        "Demand: PyPSA-China-PIK" if real else "Demand: Placeholder estimates",
+    ]
     return "Data — " + " | " .join(parts)
 
 
@@ -55,8 +73,11 @@ def _add_source(fig: plt.Figure) -> None:
 def _sim_period(network: pypsa.Network) -> str:
     """Return a human-readable string describing the simulation time span."""
     s = network.snapshots
-    t0, t1 = s[0], s[-1]
-    n = len(s)
+    return _format_period(s[0], s[-1], len(s))
+
+
+@functools.lru_cache(maxsize=8)
+def _format_period(t0: pd.Timestamp, t1: pd.Timestamp, n: int) -> str:
     if n >= 8760:
         return f"full year, {t0:%Y}"
     elif n >= 720:
@@ -67,9 +88,62 @@ def _sim_period(network: pypsa.Network) -> str:
         return f"{t0:%Y-%m-%d} ({n} h)"
 
 
+def _subplots(fig: plt.Figure | None, *args, figsize, **kwargs):
+    """plt.subplots(), or the same layout drawn into an existing figure.
+
+    A reused figure is cleared, resized and given back the default subplot
+    margins, so it renders exactly like a new one.
+    """
+    if fig is None:
+        return plt.subplots(*args, figsize=figsize, **kwargs)
+
+    fig.clear()
+    fig.set_size_inches(figsize)
+    fig.subplots_adjust(**{
+        k: plt.rcParams[f"figure.subplot.{k}"]
+        for k in ("left", "right", "bottom", "top", "wspace", "hspace")
+    })
+    return fig, fig.subplots(*args, **kwargs)
+
+
+def _decimate_for_axes(
+    frame: pd.DataFrame | pd.Series,
+    ax: plt.Axes,
+) -> pd.DataFrame | pd.Series:
+    """Reduce a time series to a min/max envelope at the axes' pixel width.
+
+    Series with fewer than four samples per horizontal pixel are returned
+    unchanged.  Otherwise each bucket of consecutive samples is replaced by
+    the rows where its total (the row sum, i.e. the top of a stacked plot)
+    is lowest and highest, in the order they occur.  Whole rows are kept,
+    so stacked columns still add up to totals that actually happened.
+    """
+    n_px = int(ax.figure.get_size_inches()[0] * _PNG_KW["dpi"])
+    n = len(frame)
+    if n <= 4 * n_px:
+        return frame
+
+    bucket = n // n_px
+    n_full = n // bucket * bucket
+    total = frame.to_numpy()[:n_full]
+    if total.ndim == 2:
+        total = total.sum(axis=1)
+    total = total.reshape(-1, bucket)
+
+    lo, hi = total.argmin(axis=1), total.argmax(axis=1)
+    starts = np.arange(0, n_full, bucket)
+    positions = np.empty(2 * len(starts), dtype=np.intp)
+    positions[0::2] = starts + np.minimum(lo, hi)
+    positions[1::2] = starts + np.maximum(lo, hi)
+    # Sorted already; unique drops the repeat when a bucket is flat
+    positions = np.concatenate([np.unique(positions), np.arange(n_full, n)])
+    return frame.iloc[positions]
+
+
 def plot_generation_dispatch(
     network: pypsa.Network,
     save_path: Path | None = None,
+    fig: plt.Figure | None = None,
 ) -> plt.Figure:
     """
     Plot stacked area chart of generation dispatch over time.
@@ -77,6 +151,7 @@ def plot_generation_dispatch(
     Args:
         network: Solved PyPSA network
         save_path: Optional path to save figure
+        fig: Optional figure to draw into (cleared first) instead of a new one
 
     Returns:
         Matplotlib figure
@@ -85,24 +160,32 @@ def plot_generation_dispatch(
         raise ValueError("Network has no generation results. Run solve first.")
 
     # Group by carrier
-    gen_by_carrier = network.generators_t.p.T.groupby(
-        network.generators.carrier
-    ).sum().T
+    gen_by_carrier = model._gen_by_carrier(network)
 
-    # Sort by baseload to peak
-    merit_order = ["nuclear", "import_hydro", "hydro", "PHS", "solar",
-                   "wind", "onwind", "offwind", "biomass", "coal",
-                   "gas", "CCGT", "OCGT"]
-    cols = [c for c in merit_order if c in gen_by_carrier.columns]
-    gen_by_carrier = gen_by_carrier[cols]
+    # Sort by baseload to peak; carriers without a rank go last
+    order = np.argsort(
+        [_MERIT_RANK.get(c, len(_MERIT_RANK)) for c in gen_by_carrier.columns],
+        kind="stable",
+    )
+    gen_by_carrier = gen_by_carrier.iloc[:, order]
 
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig, ax = _subplots(fig, figsize=(12, 6))
 
     colors = [CARRIER_COLORS.get(c, "#999999") for c in gen_by_carrier.columns]
-    gen_by_carrier.plot.area(ax=ax, color=colors, alpha=0.8, linewidth=0)
+    gen_by_carrier = _decimate_for_axes(gen_by_carrier, ax)
+    ax.stackplot(
+        gen_by_carrier.index, gen_by_carrier.to_numpy().T,
+        labels=gen_by_carrier.columns, colors=colors, alpha=0.8, linewidth=0,
+    )
+    ax.margins(x=0)
+    ax.set_ylim(bottom=0)
+    # Plain stackplot has no pandas date axis; keep its ticks readable
+    locator = mdates.AutoDateLocator()
+    ax.xaxis.set_major_locator(locator)
+    ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
 
     # Add load line
-    total_load = network.loads_t.p_set.sum(axis=1)
+    total_load = _decimate_for_axes(model._hourly_load(network), ax)
     ax.plot(total_load.index, total_load.values, "k--", linewidth=2, label="Load")
 
     ax.set_xlabel("Time")
@@ -111,18 +194,25 @@ def plot_generation_dispatch(
     ax.legend(loc="upper left", bbox_to_anchor=(1.02, 1))
     ax.grid(True, alpha=0.3)
 
-    plt.tight_layout()
+    fig.tight_layout()
     _add_source(fig)
 
     if save_path:
-        fig.savefig(save_path, dpi=150, bbox_inches="tight")
+        fig.savefig(save_path, **_PNG_KW)
 
     return fig
 
 
+@functools.lru_cache(maxsize=None)
+def _explode(n: int) -> tuple[float, ...]:
+    """Uniform pie wedge offsets for ``n`` wedges."""
+    return (0.02,) * n
+
+
 def plot_generation_mix(
     network: pypsa.Network,
     save_path: Path | None = None,
+    fig: plt.Figure | None = None,
 ) -> plt.Figure:
     """
     Plot pie chart of generation mix.
@@ -130,6 +220,7 @@ def plot_generation_mix(
     Args:
         network: Solved PyPSA network
         save_path: Optional path to save figure
+        fig: Optional figure to draw into (cleared first) instead of a new one
 
     Returns:
         Matplotlib figure
@@ -137,14 +228,12 @@ def plot_generation_mix(
     if network.generators_t.p.empty:
         raise ValueError("Network has no generation results. Run solve first.")
 
-    gen_by_carrier = network.generators_t.p.T.groupby(
-        network.generators.carrier
-    ).sum().sum(axis=1)
+    gen_by_carrier = model._gen_by_carrier(network).sum()
 
     # Filter out zero values
     gen_by_carrier = gen_by_carrier[gen_by_carrier > 0]
 
-    fig, ax = plt.subplots(figsize=(10, 8))
+    fig, ax = _subplots(fig, figsize=(10, 8))
 
     colors = [CARRIER_COLORS.get(c, "#999999") for c in gen_by_carrier.index]
 
@@ -154,21 +243,30 @@ def plot_generation_mix(
         colors=colors,
         autopct="%1.1f%%",
         startangle=90,
-        explode=[0.02] * len(gen_by_carrier),
+        explode=_explode(len(gen_by_carrier)),
     )
 
     ax.set_title(f"Guangdong Province — Generation Mix ({_sim_period(network)})")
     _add_source(fig)
 
     if save_path:
-        fig.savefig(save_path, dpi=150, bbox_inches="tight")
+        fig.savefig(save_path, **_PNG_KW)
 
     return fig
 
 
+def _bar(ax: plt.Axes, values: pd.Series, colors: list[str]) -> None:
+    """Bar chart of a Series, laid out like ``Series.plot.bar``."""
+    x = np.arange(len(values))
+    ax.bar(x, values.to_numpy(), 0.5, color=colors, edgecolor="black")
+    ax.set_xticks(x, values.index)
+    ax.set_xlim(-0.5, len(x) - 0.5)
+
+
 def plot_capacity_vs_generation(
     network: pypsa.Network,
     save_path: Path | None = None,
+    fig: plt.Figure | None = None,
 ) -> plt.Figure:
     """
     Plot comparison of installed capacity vs actual generation.
@@ -176,26 +274,25 @@ def plot_capacity_vs_generation(
     Args:
         network: Solved PyPSA network
         save_path: Optional path to save figure
+        fig: Optional figure to draw into (cleared first) instead of a new one
 
     Returns:
         Matplotlib figure
     """
     # Capacity by carrier
-    capacity = network.generators.groupby("carrier").p_nom.sum() / 1000  # GW
+    capacity = model._capacity_by_carrier(network) / 1000  # GW
 
     # Generation by carrier (GWh)
     if not network.generators_t.p.empty:
-        generation = network.generators_t.p.T.groupby(
-            network.generators.carrier
-        ).sum().sum(axis=1) / 1000  # GWh
+        generation = model._gen_by_carrier(network).sum() / 1000  # GWh
     else:
         generation = pd.Series(0, index=capacity.index)
 
-    fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+    fig, axes = _subplots(fig, 1, 2, figsize=(14, 6))
 
     # Capacity bar chart
     colors = [CARRIER_COLORS.get(c, "#999999") for c in capacity.index]
-    capacity.plot.bar(ax=axes[0], color=colors, edgecolor="black")
+    _bar(axes[0], capacity, colors)
     period = _sim_period(network)
     axes[0].set_xlabel("Carrier")
     axes[0].set_ylabel("Installed Capacity (GW)")
@@ -205,7 +302,7 @@ def plot_capacity_vs_generation(
     # Generation bar chart
     if generation.sum() > 0:
         colors = [CARRIER_COLORS.get(c, "#999999") for c in generation.index]
-        generation.plot.bar(ax=axes[1], color=colors, edgecolor="black")
+        _bar(axes[1], generation, colors)
         axes[1].set_xlabel("Carrier")
         axes[1].set_ylabel("Generation (GWh)")
         axes[1].set_title(f"Guangdong — Generation by Source ({period})")
@@ -215,11 +312,11 @@ def plot_capacity_vs_generation(
                      ha="center", va="center", transform=axes[1].transAxes)
         axes[1].set_title("Guangdong — Generation by Source")
 
-    plt.tight_layout()
+    fig.tight_layout()
     _add_source(fig)
 
     if save_path:
-        fig.savefig(save_path, dpi=150, bbox_inches="tight")
+        fig.savefig(save_path, **_PNG_KW)
 
     return fig
 
@@ -227,6 +324,7 @@ def plot_capacity_vs_generation(
 def plot_storage_operation(
     network: pypsa.Network,
     save_path: Path | None = None,
+    fig: plt.Figure | None = None,
 ) -> plt.Figure:
     """
     Plot storage unit charging/discharging and state of charge.
@@ -234,6 +332,7 @@ def plot_storage_operation(
     Args:
         network: Solved PyPSA network
         save_path: Optional path to save figure
+        fig: Optional figure to draw into (cleared first) instead of a new one
 
     Returns:
         Matplotlib figure
@@ -241,15 +340,18 @@ def plot_storage_operation(
     if network.storage_units_t.p.empty:
         raise ValueError("Network has no storage results. Run solve first.")
 
-    fig, axes = plt.subplots(2, 1, figsize=(12, 8), sharex=True)
+    fig, axes = _subplots(fig, 2, 1, figsize=(12, 8), sharex=True)
 
     # Power dispatch (positive = discharge, negative = charge)
     storage_p = network.storage_units_t.p
-    colors = [CARRIER_COLORS.get(
-        network.storage_units.loc[s, "carrier"], "#999999"
-    ) for s in storage_p.columns]
+    colors = (
+        network.storage_units.carrier.reindex(storage_p.columns)
+        .map(CARRIER_COLORS).fillna("#999999").tolist()
+    )
 
-    storage_p.plot(ax=axes[0], color=colors, linewidth=2)
+    _decimate_for_axes(storage_p, axes[0]).plot(
+        ax=axes[0], color=colors, linewidth=2
+    )
     axes[0].axhline(0, color="black", linestyle="-", linewidth=0.5)
     axes[0].set_ylabel("Power (MW)\n(+discharge / -charge)")
     axes[0].set_title(f"Guangdong — Storage Operation ({_sim_period(network)})")
@@ -259,17 +361,19 @@ def plot_storage_operation(
     # State of charge
     if not network.storage_units_t.state_of_charge.empty:
         soc = network.storage_units_t.state_of_charge
-        soc.plot(ax=axes[1], color=colors, linewidth=2)
+        _decimate_for_axes(soc, axes[1]).plot(
+            ax=axes[1], color=colors, linewidth=2
+        )
         axes[1].set_ylabel("State of Charge (MWh)")
         axes[1].set_xlabel("Time")
         axes[1].legend(loc="upper right")
         axes[1].grid(True, alpha=0.3)
 
-    plt.tight_layout()
+    fig.tight_layout()
     _add_source(fig)
 
     if save_path:
-        fig.savefig(save_path, dpi=150, bbox_inches="tight")
+        fig.savefig(save_path, **_PNG_KW)
 
     return fig
 
@@ -277,6 +381,7 @@ def plot_storage_operation(
 def plot_load_profile(
     network: pypsa.Network,
     save_path: Path | None = None,
+    fig: plt.Figure | None = None,
 ) -> plt.Figure:
     """
     Plot load profile over time.
@@ -284,23 +389,24 @@ def plot_load_profile(
     Args:
         network: PyPSA network
         save_path: Optional path to save figure
+        fig: Optional figure to draw into (cleared first) instead of a new one
 
     Returns:
         Matplotlib figure
     """
-    fig, ax = plt.subplots(figsize=(12, 5))
+    fig, ax = _subplots(fig, figsize=(12, 5))
 
-    total_load = network.loads_t.p_set.sum(axis=1)
-    ax.fill_between(total_load.index, 0, total_load.values,
-                    alpha=0.6, color="#cc3333")
-    ax.plot(total_load.index, total_load.values, color="#cc3333", linewidth=2)
+    total_load = model._hourly_load(network)
+    shown = _decimate_for_axes(total_load, ax)
+    ax.fill_between(shown.index, 0, shown.values, alpha=0.6, color="#cc3333")
+    ax.plot(shown.index, shown.values, color="#cc3333", linewidth=2)
 
     ax.set_xlabel("Time")
     ax.set_ylabel("Load (MW)")
     ax.set_title(f"Guangdong Province — Electricity Demand ({_sim_period(network)})")
     ax.grid(True, alpha=0.3)
 
-    # Add peak annotation
+    # Add peak annotation (from the full series)
     peak_idx = total_load.idxmax()
     peak_val = total_load.max()
     ax.annotate(
@@ -312,11 +418,11 @@ def plot_load_profile(
         arrowprops=dict(arrowstyle="->", color="black"),
     )
 
-    plt.tight_layout()
+    fig.tight_layout()
     _add_source(fig)
 
     if save_path:
-        fig.savefig(save_path, dpi=150, bbox_inches="tight")
+        fig.savefig(save_path, **_PNG_KW)
 
     return fig
 
@@ -324,6 +430,7 @@ def plot_load_profile(
 def plot_monthly_generation(
     monthly_gen: pd.DataFrame,
     save_path: Path | None = None,
+    fig: plt.Figure | None = None,
 ) -> plt.Figure:
     """
     Plot monthly generation by carrier as stacked bar chart.
@@ -331,11 +438,12 @@ def plot_monthly_generation(
     Args:
         monthly_gen: DataFrame with monthly generation by carrier (from model.get_monthly_generation)
         save_path: Optional path to save figure
+        fig: Optional figure to draw into (cleared first) instead of a new one
 
     Returns:
         Matplotlib figure
     """
-    fig, ax = plt.subplots(figsize=(14, 7))
+    fig, ax = _subplots(fig, figsize=(14, 7))
 
     # Reorder columns by total generation (baseload first)
     col_order = monthly_gen.sum().sort_values(ascending=False).index.tolist()
@@ -343,13 +451,16 @@ def plot_monthly_generation(
 
     colors = [CARRIER_COLORS.get(c, "#999999") for c in monthly_gen.columns]
 
-    monthly_gen.plot.bar(
-        ax=ax,
-        stacked=True,
-        color=colors,
-        edgecolor="white",
-        linewidth=0.5,
-    )
+    x = np.arange(len(monthly_gen))
+    bottom = np.zeros(len(monthly_gen))
+    for carrier, color, values in zip(
+        monthly_gen.columns, colors, monthly_gen.to_numpy().T
+    ):
+        ax.bar(x, values, 0.5, bottom=bottom, color=color, label=carrier,
+               edgecolor="white", linewidth=0.5)
+        bottom += values
+    ax.set_xticks(x, monthly_gen.index)
+    ax.set_xlim(-0.5, len(x) - 0.5)
 
     ax.set_xlabel("Month")
     ax.set_ylabel("Generation (TWh)")
@@ -358,13 +469,13 @@ def plot_monthly_generation(
     ax.grid(True, alpha=0.3, axis="y")
 
     # Rotate x labels
-    plt.xticks(rotation=0)
+    ax.tick_params(axis="x", rotation=0)
 
-    plt.tight_layout()
+    fig.tight_layout()
     _add_source(fig)
 
     if save_path:
-        fig.savefig(save_path, dpi=150, bbox_inches="tight")
+        fig.savefig(save_path, **_PNG_KW)
 
     return fig
 
@@ -372,6 +483,7 @@ def plot_monthly_generation(
 def plot_monthly_energy_mix(
     monthly_gen: pd.DataFrame,
     save_path: Path | None = None,
+    fig: plt.Figure | None = None,
 ) -> plt.Figure:
     """
     Plot monthly energy mix as percentage stacked area chart.
@@ -379,28 +491,31 @@ def plot_monthly_energy_mix(
     Args:
         monthly_gen: DataFrame with monthly generation by carrier
         save_path: Optional path to save figure
+        fig: Optional figure to draw into (cleared first) instead of a new one
 
     Returns:
         Matplotlib figure
     """
-    fig, ax = plt.subplots(figsize=(14, 7))
-
-    # Calculate percentages
-    monthly_pct = monthly_gen.div(monthly_gen.sum(axis=1), axis=0) * 100
+    fig, ax = _subplots(fig, figsize=(14, 7))
 
     # Reorder columns
-    col_order = monthly_gen.sum().sort_values(ascending=False).index.tolist()
-    monthly_pct = monthly_pct[col_order]
+    col_order = monthly_gen.sum().sort_values(ascending=False).index
+    gen = monthly_gen[col_order].to_numpy()
 
-    colors = [CARRIER_COLORS.get(c, "#999999") for c in monthly_pct.columns]
+    # Calculate percentages (months without generation stay at 0)
+    month_total = gen.sum(axis=1, keepdims=True)
+    pct = np.divide(
+        gen * 100, month_total, out=np.zeros_like(gen), where=month_total != 0
+    )
+
+    colors = [CARRIER_COLORS.get(c, "#999999") for c in col_order]
 
-    monthly_pct.plot.area(
-        ax=ax,
-        stacked=True,
-        color=colors,
-        alpha=0.8,
-        linewidth=0,
+    x = np.arange(len(pct))
+    ax.stackplot(
+        x, pct.T, labels=col_order, colors=colors, alpha=0.8, linewidth=0,
     )
+    ax.set_xticks(x, monthly_gen.index)
+    ax.margins(x=0)
 
     ax.set_xlabel("Month")
     ax.set_ylabel("Share (%)")
@@ -409,11 +524,11 @@ def plot_monthly_energy_mix(
     ax.legend(title="Source", bbox_to_anchor=(1.02, 1), loc="upper left")
     ax.grid(True, alpha=0.3, axis="y")
 
-    plt.tight_layout()
+    fig.tight_layout()
     _add_source(fig)
 
     if save_path:
-        fig.savefig(save_path, dpi=150, bbox_inches="tight")
+        fig.savefig(save_path, **_PNG_KW)
 
     return fig
 
@@ -421,6 +536,7 @@ def plot_monthly_energy_mix(
 def plot_yearly_summary(
     yearly_stats: dict,
     save_path: Path | None = None,
+    fig: plt.Figure | None = None,
 ) -> plt.Figure:
     """
     Plot yearly summary with generation mix pie and key statistics.
@@ -428,11 +544,12 @@ def plot_yearly_summary(
     Args:
         yearly_stats: Dictionary from model.get_yearly_statistics()
         save_path: Optional path to save figure
+        fig: Optional figure to draw into (cleared first) instead of a new one
 
     Returns:
         Matplotlib figure
     """
-    fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+    fig, axes = _subplots(fig, 1, 2, figsize=(14, 6))
 
     # Pie chart of generation mix
     gen_mix = yearly_stats.get("generation_mix_pct", {})
@@ -476,11 +593,11 @@ def plot_yearly_summary(
     axes[1].axis("off")
     axes[1].set_title("Key Statistics")
 
-    plt.tight_layout()
+    fig.tight_layout()
     _add_source(fig)
 
     if save_path:
-        fig.savefig(save_path, dpi=150, bbox_inches="tight")
+        fig.savefig(save_path, **_PNG_KW)
 
     return fig
 
@@ -503,23 +620,36 @@ def create_summary_report(
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    # All plots are drawn into one figure, cleared between plots, rather
+    # than allocating (and leaking) a new figure and canvas for each.  The
+    # figure is not registered with pyplot, so it renders with Agg whatever
+    # the interactive backend is and needs no plt.close().
+    fig = Figure()
+    FigureCanvasAgg(fig)
+
     # Generate basic plots
-    plot_load_profile(network, output_dir / "load_profile.png")
-    plot_capacity_vs_generation(network, output_dir / "capacity_generation.png")
+    plot_load_profile(network, output_dir / "load_profile.png", fig=fig)
+    plot_capacity_vs_generation(network, output_dir / "capacity_generation.png", fig=fig)
 
     if not network.generators_t.p.empty:
-        plot_generation_dispatch(network, output_dir / "generation_dispatch.png")
-        plot_generation_mix(network, output_dir / "generation_mix.png")
+        plot_generation_dispatch(network, output_dir / "generation_dispatch.png", fig=fig)
+        plot_generation_mix(network, output_dir / "generation_mix.png", fig=fig)
 
     if not network.storage_units_t.p.empty:
-        plot_storage_operation(network, output_dir / "storage_operation.png")
+        plot_storage_operation(network, output_dir / "storage_operation.png", fig=fig)
 
     # Generate yearly/monthly plots if data provided
     if yearly_stats:
-        plot_yearly_summary(yearly_stats, output_dir / "yearly_summary.png")
+        plot_yearly_summary(yearly_stats, output_dir / "yearly_summary.png", fig=fig)
 
     if monthly_gen is not None and not monthly_gen.empty:
-        plot_monthly_generation(monthly_gen, output_dir / "monthly_generation.png")
-        plot_monthly_energy_mix(monthly_gen, output_dir / "monthly_energy_mix.png")
+        plot_monthly_generation(monthly_gen, output_dir / "monthly_generation.png", fig=fig)
+        plot_monthly_energy_mix(monthly_gen, output_dir / "monthly_energy_mix.png", fig=fig)
+
+    # Figures and their artists form reference cycles; release the last
+    # plot's data and Agg buffer now rather than at the next GC pass
+    fig.clear()
+    del fig
+    gc.collect()
 
     print(f"Report saved to {output_dir}")